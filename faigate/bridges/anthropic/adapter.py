@@ -465,6 +465,22 @@ def anthropic_sse_event(event_type: str, payload: dict[str, Any]) -> bytes:
     return f"event: {event_type}\ndata: {body}\n\n".encode()
 
 
+async def _iter_sse_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield complete lines from a byte stream regardless of upstream chunking.
+
+    Providers forward raw transport chunks, so one chunk may hold several SSE
+    lines or end mid-line; this rebuffers them into parseable units.
+    """
+    buffer = b""
+    async for chunk in stream:
+        buffer += chunk
+        while (newline := buffer.find(b"\n")) >= 0:
+            yield buffer[:newline]
+            buffer = buffer[newline + 1 :]
+    if buffer:
+        yield buffer
+
+
 async def openai_sse_to_anthropic(
     stream: AsyncIterator[bytes],
     *,
@@ -510,7 +526,7 @@ async def openai_sse_to_anthropic(
     )
 
     try:
-        async for raw_line in stream:
+        async for raw_line in _iter_sse_lines(stream):
             line = raw_line.decode("utf-8", errors="replace").strip()
             if not line or not line.startswith("data:"):
                 continue
@@ -18,15 +18,22 @@ set via FAIGATE_DB_PATH in the service environment.
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import ipaddress
 import os
+import pickle
 import re
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
 import yaml
-from dotenv import load_dotenv
+
+try:  # libyaml binding: 2-5x faster parse, falls back to pure Python
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on how pyyaml was built
+    from yaml import SafeLoader as _YamlSafeLoader
 
 from .hooks import get_registered_request_hooks, load_community_hooks
 from .lane_registry import get_provider_lane_binding, get_provider_transport_binding
@@ -184,30 +191,69 @@ class ConfigError(ValueError):
     """Raised when config.yaml contains an invalid runtime configuration."""
 
 
-def _expand_env(value: str) -> str:
-    """Expand ${VAR} and ${VAR:-default} patterns in a string."""
+_ENV_RE = re.compile(r"\$\{([^}]+)}")
+
+
+def _expand_env(value: str, _memo: dict[str, str] | None = None) -> str:
+    """Expand ${VAR} and ${VAR:-default} patterns in a string.
+
+    ``_memo`` (used by :func:`_walk_expand`) caches resolved ``${...}``
+    specs for the duration of one config pass, so a variable referenced
+    dozens of times costs one environ lookup and one ``:-`` split.
+    """
+    # Most YAML strings contain no template at all – skip the regex engine.
+    if "${" not in value:
+        return value
 
     def _replace(m: re.Match) -> str:
         var = m.group(1)
+        if _memo is not None:
+            cached = _memo.get(var)
+            if cached is not None:
+                return cached
         if ":-" in var:
             name, default = var.split(":-", 1)
-            return os.environ.get(name, default)
-        return os.environ.get(var, m.group(0))
+            resolved = os.environ.get(name, default)
+        else:
+            resolved = os.environ.get(var, m.group(0))
+        if _memo is not None:
+            _memo[var] = resolved
+        return resolved
+
+    return _ENV_RE.sub(_replace, value)
 
-    return re.sub(r"\$\{([^}]+)}", _replace, value)
 
+def _walk_expand(obj: Any, _memo: dict[str, str] | None = None) -> Any:
+    """Expand env vars in all string values.
 
-def _walk_expand(obj: Any) -> Any:
-    """Recursively expand env vars in all string values."""
+    Walks the parsed YAML with an explicit worklist instead of recursing —
+    one Python frame total rather than one per node — and rewrites strings
+    in place only when they actually contain a ``${`` template. Callers may
+    pass ``_memo`` to observe which ``${...}`` specs were resolved.
+    """
     if isinstance(obj, str):
-        return _expand_env(obj)
-    if isinstance(obj, dict):
-        return {k: _walk_expand(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_walk_expand(v) for v in obj]
+        return _expand_env(obj, _memo)
+    if not isinstance(obj, (dict, list)):
+        return obj
+    memo: dict[str, str] = {} if _memo is None else _memo
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, str):
+                if "${" in value:
+                    node[key] = _expand_env(value, memo)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
     return obj
 
 
+# Relative DB paths that would pollute a repo checkout. Exact names here;
+# suffixed variants (./faigate.db-wal, …) are caught by the prefix check.
+_FORBIDDEN_DB_PATHS = frozenset({"faigate.db", "./faigate.db"})
+
+
 def _safe_db_path(configured: str | None = None) -> str:
     """Return a safe, out-of-repo default DB path.
 
@@ -225,7 +271,7 @@ def _safe_db_path(configured: str | None = None) -> str:
     # 2. Explicit config value – but reject ./faigate.db* to prevent repo pollution
     if configured:
         p = configured.strip()
-        if p and not p.startswith("./faigate.db") and p != "faigate.db":
+        if p and p not in _FORBIDDEN_DB_PATHS and not p.startswith("./faigate.db"):
             return p
 
     # 3. XDG_DATA_HOME
@@ -2030,6 +2076,18 @@ class Config:
     def health(self) -> dict:
         return self._data.get("health", {})
 
+    @functools.cached_property
+    def db_path(self) -> str:
+        """Resolved metrics DB path, without building the merged ``metrics`` dict.
+
+        Cached per instance: ``_safe_db_path`` does several env-var lookups
+        plus a ``Path.home()`` call, and callers that only want the path
+        (the stats CLI) shouldn't pay for the dict copy ``metrics`` makes.
+        """
+        raw = self._data.get("metrics")
+        configured = raw.get("db_path") if isinstance(raw, dict) else None
+        return _safe_db_path(configured)
+
     @property
     def metrics(self) -> dict:
         raw = self._data.get("metrics", {"enabled": False})
@@ -2174,6 +2232,82 @@ class Config:
         return self.providers.get(name)
 
 
+# ── Config snapshot cache ───────────────────────────────────────────────────
+#
+# Repeated CLI invocations (cron, shell prompts) re-parse the same YAML every
+# time. The expanded (pre-normalization) tree is pickled to the XDG cache dir
+# keyed on the config file's mtime+size; the snapshot also records every
+# ${VAR} spec it resolved so a change to any referenced env var invalidates
+# it. Normalization still runs on every load — it performs validation and
+# loads community hooks, so it must not be skipped.
+
+
+def _config_snapshot_path() -> Path:
+    cache_root = os.environ.get("XDG_CACHE_HOME", "").strip()
+    base = Path(cache_root) if cache_root else Path.home() / ".cache"
+    return base / "faigate" / "config-snapshot.pkl"
+
+
+def _config_snapshot_enabled() -> bool:
+    return os.environ.get("FAIGATE_CONFIG_SNAPSHOT", "1").strip().lower() not in {"0", "false", "no"}
+
+
+def _resolve_env_spec(spec: str) -> str:
+    """Resolve a ``${...}`` spec exactly as :func:`_expand_env` would."""
+    if ":-" in spec:
+        name, default = spec.split(":-", 1)
+        return os.environ.get(name, default)
+    return os.environ.get(spec, f"${{{spec}}}")
+
+
+def _env_ref_digest(resolved: str) -> str:
+    """Digest of a resolved ``${...}`` value, so the snapshot can detect env
+    changes without persisting the value itself (it may be a secret)."""
+    return hashlib.sha256(resolved.encode("utf-8")).hexdigest()
+
+
+def _load_config_snapshot(path: Path, stat: os.stat_result) -> dict | None:
+    try:
+        with _config_snapshot_path().open("rb") as f:
+            snap = pickle.load(f)
+        if snap.get("source") != str(path):
+            return None
+        if snap.get("key") != (stat.st_mtime_ns, stat.st_size):
+            return None
+        for spec, digest in snap.get("env_refs", {}).items():
+            if _env_ref_digest(_resolve_env_spec(spec)) != digest:
+                return None
+        data = snap.get("data")
+        return data if isinstance(data, dict) else None
+    except Exception:
+        return None
+
+
+def _save_config_snapshot(path: Path, stat: os.stat_result, env_refs: dict[str, str], data: dict) -> None:
+    try:
+        target = _config_snapshot_path()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        # The expanded tree contains resolved secrets; create the file 0600
+        # regardless of umask (replace() carries the mode to the target).
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(
+                {
+                    "source": str(path),
+                    "key": (stat.st_mtime_ns, stat.st_size),
+                    "env_refs": {spec: _env_ref_digest(resolved) for spec, resolved in env_refs.items()},
+                    "data": data,
+                },
+                f,
+                pickle.HIGHEST_PROTOCOL,
+            )
+        tmp.replace(target)
+    except Exception:
+        # Best-effort cache: a read-only cache dir must never break startup.
+        pass
+
+
 def load_config(path: str | Path | None = None) -> Config:
     """Load config.yaml, expand env vars, return Config object."""
     # Resolve env file: FAIGATE_ENV_FILE takes precedence, then look next to
@@ -2181,21 +2315,31 @@ def load_config(path: str | Path | None = None) -> Config:
     # or calling-frame walk-up).  This ensures the installed Homebrew package
     # finds faigate.env in /opt/homebrew/etc/faigate/ even though load_dotenv()
     # would otherwise search from the site-packages directory.
-    _faigate_env_file: str | None = os.environ.get("FAIGATE_ENV_FILE")
-    if not _faigate_env_file:
-        _config_env = os.environ.get("FAIGATE_CONFIG_FILE") or os.environ.get("FAIGATE_CONFIG_PATH")
-        if _config_env:
-            _candidate = Path(_config_env).parent / ".env"
-            if _candidate.exists():
-                _faigate_env_file = str(_candidate)
-            else:
-                _candidate2 = Path(_config_env).parent / "faigate.env"
-                if _candidate2.exists():
-                    _faigate_env_file = str(_candidate2)
-    if _faigate_env_file:
-        load_dotenv(_faigate_env_file)
-    else:
-        load_dotenv()
+    #
+    # dotenv is imported lazily and only when an env file can actually exist:
+    # systemd/container deployments that inject env vars directly (and set
+    # FAIGATE_SKIP_DOTENV=1, or simply have no .env anywhere) skip the import
+    # entirely, which keeps it off the startup path.
+    if not os.environ.get("FAIGATE_SKIP_DOTENV", "").strip():
+        _faigate_env_file: str | None = os.environ.get("FAIGATE_ENV_FILE")
+        if not _faigate_env_file:
+            _config_env = os.environ.get("FAIGATE_CONFIG_FILE") or os.environ.get("FAIGATE_CONFIG_PATH")
+            if _config_env:
+                _candidate = Path(_config_env).parent / ".env"
+                if _candidate.exists():
+                    _faigate_env_file = str(_candidate)
+                else:
+                    _candidate2 = Path(_config_env).parent / "faigate.env"
+                    if _candidate2.exists():
+                        _faigate_env_file = str(_candidate2)
+        if _faigate_env_file:
+            from dotenv import load_dotenv
+
+            load_dotenv(_faigate_env_file)
+        elif (Path.cwd() / ".env").exists() or (Path.home() / ".env").exists():
+            from dotenv import load_dotenv
+
+            load_dotenv()
 
     if path is None:
         env_path = os.environ.get("FAIGATE_CONFIG_FILE") or os.environ.get("FAIGATE_CONFIG_PATH")
@@ -2216,8 +2360,24 @@ def load_config(path: str | Path | None = None) -> Config:
             raise FileNotFoundError("config.yaml not found")
 
     path = Path(path)
-    with path.open() as f:
-        raw = yaml.safe_load(f)
+    snapshot_enabled = _config_snapshot_enabled()
+    stat: os.stat_result | None = None
+    expanded_raw: dict | None = None
+    if snapshot_enabled:
+        try:
+            stat = path.stat()
+        except OSError:
+            stat = None
+        if stat is not None:
+            expanded_raw = _load_config_snapshot(path, stat)
+
+    if expanded_raw is None:
+        with path.open() as f:
+            raw = yaml.load(f, Loader=_YamlSafeLoader)
+        env_refs: dict[str, str] = {}
+        expanded_raw = _walk_expand(raw, env_refs)
+        if snapshot_enabled and stat is not None and isinstance(expanded_raw, dict):
+            _save_config_snapshot(path, stat, env_refs, expanded_raw)
 
     expanded = _normalize_metadata_sync(
         _normalize_provider_source_refresh(
@@ -2234,7 +2394,7 @@ def load_config(path: str | Path | None = None) -> Config:
                                                     _normalize_client_profiles(
                                                         _normalize_routing_policies(
                                                             _normalize_fallback_chain(
-                                                                _normalize_providers(_walk_expand(raw))
+                                                                _normalize_providers(expanded_raw)
                                                             )
                                                         )
                                                     )
@@ -10,9 +10,11 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import gzip
 import html as html_lib
 import json
 import logging
+import logging.handlers
 import mimetypes
 import os
 import re
@@ -26,10 +28,17 @@ from hashlib import sha256
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse
 from starlette.datastructures import UploadFile
 
+try:  # pragma: no cover - exercised indirectly when orjson is installed
+    import orjson as _orjson
+    from fastapi.responses import ORJSONResponse as _JSONResponse
+except ImportError:  # pragma: no cover
+    _orjson = None
+    _JSONResponse = JSONResponse
+
 from . import __version__
 from .adaptation import AdaptiveRouteState
 from .api.anthropic.models import AnthropicBridgeError, parse_anthropic_messages_request
@@ -77,7 +86,13 @@ from .provider_catalog_refresh import (
 )
 from .provider_catalog_store import ProviderCatalogStore
 from .provider_sources import list_provider_sources
-from .providers import ProviderBackend, ProviderError, classify_runtime_issue, create_provider_backend
+from .providers import (
+    ProviderBackend,
+    ProviderError,
+    aclose_shared_clients,
+    classify_runtime_issue,
+    create_provider_backend,
+)
 from .router import Router, RoutingDecision
 from .updates import (
     UpdateChecker,
@@ -100,6 +115,8 @@ _provider_catalog_store: ProviderCatalogStore | None = None
 _provider_catalog_refresh_task: asyncio.Task[None] | None = None
 _metadata_catalog_sync_task: asyncio.Task[None] | None = None
 _quota_poll_task: asyncio.Task[None] | None = None
+_prewarm_task: asyncio.Task[None] | None = None
+_log_listener: logging.handlers.QueueListener | None = None
 
 
 def _provider_catalog_config_path() -> str:
@@ -532,15 +549,18 @@ async def _metadata_catalog_sync_loop() -> None:
             logger.warning("Metadata catalog scheduled refresh failed: %s", exc)
 
 
+_ROUTING_HEADER_PREFIXES = (b"x-openclaw", b"x-faigate")
+
+
 def _collect_routing_headers(request: Request) -> dict[str, str]:
     """Return the request headers that are relevant for routing decisions."""
-    prefixes = ("x-openclaw", "x-faigate")
+    # ASGI raw headers are lowercased bytes already; scanning them avoids
+    # decoding and re-lowercasing every header just to discard most of them.
+    matched = [(k, v) for k, v in request.headers.raw if k.startswith(_ROUTING_HEADER_PREFIXES)]
+    if not matched:
+        return {}
     max_chars = int((_config.security or {}).get("max_header_value_chars", 160))
-    return {
-        k.lower(): _sanitize_header_value(v, max_chars=max_chars)
-        for k, v in request.headers.items()
-        if k.lower().startswith(prefixes)
-    }
+    return {k.decode("latin-1"): _sanitize_header_value(v.decode("latin-1"), max_chars=max_chars) for k, v in matched}
 
 
 def _collect_anthropic_bridge_headers(request: Request) -> dict[str, str]:
@@ -835,21 +855,51 @@ def _resolve_requested_model(
     return normalized, None, None, None, {}
 
 
+_attempt_order_cache: dict[str, list[str]] = {}
+_attempt_order_stamp: tuple[int, int, int] | None = None
+
+
 def _build_attempt_order(
     primary_provider: str,
     *,
     required_capabilities: list[str] | None = None,
 ) -> list[str]:
-    """Return the provider attempt order for one routed request."""
-    attempt_order = []
+    """Return the provider attempt order for one routed request.
+
+    The capability-free form (the chat hot path) is memoized per primary:
+    the fallback chain and provider registry only change at startup, so the
+    chain scan runs once per provider instead of on every request. The stamp
+    catches tests swapping the registry out from under the cache.
+    """
+    global _attempt_order_stamp
+    if required_capabilities:
+        return _attempt_order_uncached(primary_provider, required_capabilities)
+    stamp = (id(_providers), len(_providers), id(_config))
+    if stamp != _attempt_order_stamp:
+        _attempt_order_cache.clear()
+        _attempt_order_stamp = stamp
+    order = _attempt_order_cache.get(primary_provider)
+    if order is None:
+        order = _attempt_order_uncached(primary_provider, None)
+        _attempt_order_cache[primary_provider] = order
+    return list(order)
+
+
+def _attempt_order_uncached(
+    primary_provider: str,
+    required_capabilities: list[str] | None,
+) -> list[str]:
+    attempt_order: list[str] = []
+    seen: set[str] = set()
     for provider_name in [primary_provider, *_config.fallback_chain]:
         provider = _providers.get(provider_name)
-        if not provider or provider_name in attempt_order:
+        if not provider or provider_name in seen:
             continue
         if required_capabilities and any(
             not provider.capabilities.get(capability) for capability in required_capabilities
         ):
             continue
+        seen.add(provider_name)
         attempt_order.append(provider_name)
     return attempt_order
 
@@ -1501,6 +1551,7 @@ def _build_provider_inventory(
                 "route_runtime_state": _provider_runtime_state_snapshot().get(name, {}),
                 "last_error": getattr(provider.health, "last_error", ""),
                 "avg_latency_ms": getattr(provider.health, "avg_latency_ms", 0.0),
+                "in_flight": getattr(provider, "in_flight", 0),
             }
         )
 
@@ -1748,19 +1799,24 @@ async def _resolve_route_preview(
         )
     else:
         health_map = {name: p.health.to_dict() for name, p in _providers.items()}
-        decision = await _router.route(
-            messages,
-            model_requested=effective_model_requested,
-            has_tools=bool(tools),
-            requested_max_tokens=max_tokens,
-            client_profile=client_profile,
-            profile_hints=merged_hints,
-            hook_hints=hook_state.routing_hints,
-            applied_hooks=hook_state.applied_hooks,
-            headers=_merge_routing_context_headers(headers, body),
-            provider_health=health_map,
-            provider_runtime_state=_provider_runtime_state_snapshot(),
-        )
+        route_features = {
+            "model_requested": effective_model_requested,
+            "has_tools": bool(tools),
+            "requested_max_tokens": max_tokens,
+            "client_profile": client_profile,
+            "profile_hints": merged_hints,
+            "hook_hints": hook_state.routing_hints,
+            "applied_hooks": hook_state.applied_hooks,
+            "headers": _merge_routing_context_headers(headers, body),
+            "provider_health": health_map,
+            "provider_runtime_state": _provider_runtime_state_snapshot(),
+        }
+        if _router.llm_classifier_enabled:
+            decision = await _router.route(messages, **route_features)
+        else:
+            # Classifier off (the default): stay on the sync path and skip
+            # the per-request coroutine frame entirely.
+            decision = _router.route_sync(messages, **route_features)
 
     return (
         decision,
@@ -1811,13 +1867,14 @@ async def _execute_chat_completion_body(
     tools = effective_body.get("tools")
     extra_body = _completion_extra_body(effective_body)
 
-    logger.info(
-        "Route: %s [%s/%s] %.1fms",
-        decision.provider_name,
-        decision.layer,
-        decision.rule_name,
-        decision.elapsed_ms,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Route: %s [%s/%s] %.1fms",
+            decision.provider_name,
+            decision.layer,
+            decision.rule_name,
+            decision.elapsed_ms,
+        )
 
     errors: list[dict[str, Any]] = []
     blocked_quota_groups: dict[str, dict[str, str]] = {}
@@ -1885,6 +1942,8 @@ async def _execute_chat_completion_body(
                 provider_name,
                 latency_ms=(result.get("_faigate") or {}).get("latency_ms", 0) if isinstance(result, dict) else 0.0,
             )
+            # Teach the router which provider now holds this prompt prefix warm.
+            _router.note_completion(messages, provider_name)
 
             trace_id: str | None = None
             if _config.metrics.get("enabled") and isinstance(result, dict):
@@ -2072,7 +2131,8 @@ async def _read_json_body(request: Request, *, operation: str) -> dict[str, Any]
     if len(raw) > max_bytes:
         raise PayloadTooLargeError(f"{operation} body exceeded security.max_json_body_bytes ({len(raw)} > {max_bytes})")
     try:
-        parsed = json.loads(raw.decode("utf-8"))
+        # orjson parses the raw bytes directly, skipping the intermediate str.
+        parsed = _orjson.loads(raw) if _orjson is not None else json.loads(raw.decode("utf-8"))
     except (UnicodeDecodeError, json.JSONDecodeError) as exc:
         raise ValueError("Invalid JSON body") from exc
     if not isinstance(parsed, dict):
@@ -2348,13 +2408,23 @@ async def lifespan(app: FastAPI):
     """Startup / shutdown lifecycle."""
     global _config, _providers, _router, _metrics, _update_checker, _adaptive_state
     global _provider_catalog_store, _provider_catalog_refresh_task, _metadata_catalog_sync_task
-    global _quota_poll_task
+    global _quota_poll_task, _prewarm_task, _log_listener
 
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(name)s] %(levelname)s %(message)s",
         datefmt="%H:%M:%S",
     )
+    # Route log records through a queue so timestamp formatting and the
+    # synchronous stderr write happen on a background thread, not per request.
+    root_logger = logging.getLogger()
+    if _log_listener is None and root_logger.handlers:
+        import queue as queue_mod
+
+        log_queue: queue_mod.Queue = queue_mod.Queue(-1)
+        _log_listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+        root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+        _log_listener.start()
 
     _config = load_config()
     logger.info("Loaded config with %d providers", len(_config.providers))
@@ -2383,6 +2453,13 @@ async def lifespan(app: FastAPI):
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to register virtual provider %s: %s", vp_name, exc)
 
+    # Prime upstream TLS connections in the background so the first real
+    # completion per provider does not pay the handshake.
+    async def _prewarm_all() -> None:
+        await asyncio.gather(*(p.prewarm() for p in _providers.values()), return_exceptions=True)
+
+    _prewarm_task = asyncio.create_task(_prewarm_all())
+
     _router = Router(_config)
     _adaptive_state = AdaptiveRouteState()
     await _refresh_local_worker_probes(force=True)
@@ -2398,9 +2475,15 @@ async def lifespan(app: FastAPI):
     )
 
     # Metrics
-    _metrics = MetricsStore(db_path=_config.metrics["db_path"])
+    _metrics = MetricsStore(
+        db_path=_config.metrics["db_path"],
+        synchronous=str(_config.metrics.get("synchronous", "NORMAL")),
+    )
     if _config.metrics.get("enabled"):
         _metrics.init()
+        # Batch request INSERTs off the request path (one fsync per batch
+        # instead of per call); reads still flush pending rows first.
+        _metrics.start_batch_writer()
 
     # Circuit breakers — persist state in the same SQLite database
     breaker_registry.configure_persistence(_config.metrics["db_path"])
@@ -2477,9 +2560,16 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    if _prewarm_task is not None:
+        _prewarm_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await _prewarm_task
+        _prewarm_task = None
     for p in _providers.values():
         await p.close()
+    await aclose_shared_clients()
     await _update_checker.close()
+    await _metrics.stop_batch_writer()
     _metrics.close()
     if _provider_catalog_refresh_task is not None:
         _provider_catalog_refresh_task.cancel()
@@ -2500,6 +2590,10 @@ async def lifespan(app: FastAPI):
         _provider_catalog_store.close()
         _provider_catalog_store = None
     logger.info("fusionAIze Gate shut down")
+    if _log_listener is not None:
+        _log_listener.stop()  # flushes queued records
+        logging.getLogger().handlers = list(_log_listener.handlers)
+        _log_listener = None
 
 
 app = FastAPI(
@@ -2507,6 +2601,7 @@ app = FastAPI(
     version=__version__,
     description="Local OpenAI-compatible routing gateway for OpenClaw and other clients.",
     lifespan=lifespan,
+    default_response_class=_JSONResponse,
 )
 
 
@@ -2815,6 +2910,39 @@ async def stats(
         "status": operator_status,
         "client_tag": client_tag,
     }
+    # Concurrent dashboard viewers polling the same filters share one set of
+    # aggregation scans: results are cached for a few seconds, keyed on the
+    # filters plus the store's write generation so any committed (or pending
+    # batched) row invalidates immediately.
+    cache_key = (
+        tuple(sorted(filters.items())),
+        tuple(sorted(operator_filters.items())),
+        _metrics.write_generation,
+    )
+    now = time.monotonic()
+    hit = _stats_payload_cache.get(cache_key)
+    if hit is not None and hit[0] > now:
+        payload = hit[1]
+    else:
+        # All SQLite scans run on the metrics worker thread in one hop so the
+        # aggregation-heavy dashboard poll never blocks the event loop.
+        payload = await _metrics.run_off_loop(_stats_metrics_payload, filters, operator_filters)
+        if len(_stats_payload_cache) >= 64:
+            _stats_payload_cache.clear()
+        _stats_payload_cache[cache_key] = (now + _STATS_CACHE_TTL, payload)
+
+    response = dict(payload)
+    response["packages_summary"] = _metadata_catalogs_summary()["packages"]
+    response["packages_detail"] = _metadata_packages_detail()
+    return response
+
+
+_STATS_CACHE_TTL = 3.0
+_stats_payload_cache: dict[tuple, tuple[float, dict]] = {}
+
+
+def _stats_metrics_payload(filters: dict, operator_filters: dict) -> dict:
+    """Blocking portion of /api/stats; runs on the metrics worker thread."""
     client_totals = _metrics.get_client_totals(**filters)
     return {
         "totals": _metrics.get_totals(**filters),
@@ -2829,8 +2957,6 @@ async def stats(
         "operator_actions": _metrics.get_operator_breakdown(**operator_filters),
         "hourly": _metrics.get_hourly_series(24),
         "daily": _metrics.get_daily_totals(30),
-        "packages_summary": _metadata_catalogs_summary()["packages"],
-        "packages_detail": _metadata_packages_detail(),
     }
 
 
@@ -2846,7 +2972,8 @@ async def recent(
 ):
     """Recent request log."""
     return {
-        "requests": _metrics.get_recent(
+        "requests": await _metrics.run_off_loop(
+            _metrics.get_recent,
             limit,
             provider=provider,
             modality=modality,
@@ -2869,7 +2996,8 @@ async def traces(
     success: bool | None = None,
 ):
     """Recent enriched route traces for debugging and policy tuning."""
-    trace_rows = _metrics.get_recent(
+    trace_rows = await _metrics.run_off_loop(
+        _metrics.get_recent,
         limit,
         provider=provider,
         modality=modality,
@@ -3422,6 +3550,25 @@ async def image_generations(request: Request):
         provider = _providers.get(provider_name)
         if not provider:
             continue
+        breaker = breaker_registry.get_or_create(provider_name)
+        if not breaker.allow_request():
+            logger.info(
+                "Skipping image provider %s — circuit breaker %s (cooldown %.0fs remaining)",
+                provider_name,
+                breaker.state,
+                breaker.cooldown_remaining_s,
+            )
+            errors.append(
+                {
+                    "provider": provider_name,
+                    "status": 0,
+                    "category": "circuit-open",
+                    "circuit_state": str(breaker.state),
+                    "cooldown_remaining_s": round(breaker.cooldown_remaining_s, 1),
+                }
+            )
+            continue
+
         if not provider.health.healthy and provider_name != attempt_order[0]:
             continue
 
@@ -3430,6 +3577,7 @@ async def image_generations(request: Request):
                 prompt,
                 extra_body=image_fields,
             )
+            breaker.record_success()
             _adaptive_state.record_success(
                 provider_name,
                 latency_ms=(result.get("_faigate") or {}).get("latency_ms", 0) if isinstance(result, dict) else 0.0,
@@ -3458,7 +3606,7 @@ async def image_generations(request: Request):
                 )
                 trace_id = str(row_id) if row_id is not None else str(uuid.uuid4())
 
-            resp = JSONResponse(result)
+            resp = _JSONResponse(result)
             resp.headers["X-faigate-Provider"] = provider_name
             resp.headers["X-faigate-Profile"] = client_profile
             if resolved_mode:
@@ -3472,6 +3620,7 @@ async def image_generations(request: Request):
             resp.headers["x-faigate-trace-id"] = trace_id or str(uuid.uuid4())
             return resp
         except ProviderError as exc:
+            breaker.record_failure(error=exc.detail[:500])
             _adaptive_state.record_failure(provider_name, error=exc.detail[:500])
             errors.append(_serialize_provider_attempt_error(provider_name, exc))
             logger.warning(
@@ -3567,6 +3716,25 @@ async def image_edits(request: Request):
         provider = _providers.get(provider_name)
         if not provider:
             continue
+        breaker = breaker_registry.get_or_create(provider_name)
+        if not breaker.allow_request():
+            logger.info(
+                "Skipping image-edit provider %s — circuit breaker %s (cooldown %.0fs remaining)",
+                provider_name,
+                breaker.state,
+                breaker.cooldown_remaining_s,
+            )
+            errors.append(
+                {
+                    "provider": provider_name,
+                    "status": 0,
+                    "category": "circuit-open",
+                    "circuit_state": str(breaker.state),
+                    "cooldown_remaining_s": round(breaker.cooldown_remaining_s, 1),
+                }
+            )
+            continue
+
         if not provider.health.healthy and provider_name != attempt_order[0]:
             continue
 
@@ -3580,6 +3748,7 @@ async def image_edits(request: Request):
                 response_format=effective_body.get("response_format"),
                 user=effective_body.get("user"),
             )
+            breaker.record_success()
             _adaptive_state.record_success(
                 provider_name,
                 latency_ms=(result.get("_faigate") or {}).get("latency_ms", 0) if isinstance(result, dict) else 0.0,
@@ -3608,7 +3777,7 @@ async def image_edits(request: Request):
                 )
                 trace_id = str(row_id) if row_id is not None else str(uuid.uuid4())
 
-            resp = JSONResponse(result)
+            resp = _JSONResponse(result)
             resp.headers["X-faigate-Provider"] = provider_name
             resp.headers["X-faigate-Profile"] = client_profile
             if resolved_mode:
@@ -3622,6 +3791,7 @@ async def image_edits(request: Request):
             resp.headers["x-faigate-trace-id"] = trace_id or str(uuid.uuid4())
             return resp
         except ProviderError as exc:
+            breaker.record_failure(error=exc.detail[:500])
             _adaptive_state.record_failure(provider_name, error=exc.detail[:500])
             errors.append(_serialize_provider_attempt_error(provider_name, exc))
             logger.warning(
@@ -3664,9 +3834,19 @@ async def image_edits(request: Request):
 
 
 @app.get("/dashboard", response_class=HTMLResponse)
-async def dashboard():
-    """Minimal self-contained dashboard – no build step, no deps."""
-    return _DASHBOARD_HTML
+async def dashboard(request: Request):
+    """Minimal self-contained dashboard – no build step, no deps.
+
+    The body never changes between restarts, so it is pre-encoded and
+    pre-gzipped at import and revalidated with a strong ETag.
+    """
+    if request.headers.get("if-none-match") == _DASHBOARD_ETAG:
+        return Response(status_code=304, headers={"ETag": _DASHBOARD_ETAG})
+    headers = {"ETag": _DASHBOARD_ETAG, "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(_DASHBOARD_HTML_GZIP, media_type="text/html", headers=headers)
+    return Response(_DASHBOARD_HTML_BYTES, media_type="text/html", headers=headers)
 
 
 _QUOTAS_DASHBOARD_HTML = """<!doctype html>
@@ -4963,6 +5143,8 @@ async def chat_completions(request: Request):
             ),
             media_type="text/event-stream",
             headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
                 "X-faigate-Provider": execution.provider_name,
                 "X-faigate-Profile": execution.client_profile,
                 "X-faigate-Circuit": circuit_state,
@@ -5064,6 +5246,8 @@ async def anthropic_messages(request: Request):
             ),
             media_type="text/event-stream",
             headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
                 "X-faigate-Provider": execution.provider_name,
                 "X-faigate-Profile": execution.client_profile,
                 "X-faigate-Layer": execution.decision.layer,
@@ -5197,12 +5381,19 @@ def main():
         os.environ["FAIGATE_CONFIG_FILE"] = args.config
 
     config = load_config()
+    # workers > 1 is safe for the metrics DB (WAL + busy_timeout), but the
+    # in-process TTL caches and provider health state become per-worker.
+    workers = int(config.server.get("workers", 1))
     uvicorn.run(
         "faigate.main:app",
         host=config.server.get("host", "127.0.0.1"),
         port=config.server.get("port", 8090),
         log_level=config.server.get("log_level", "info"),
         reload=False,
+        workers=workers if workers > 1 else None,
+        # "auto" upgrades to uvloop/httptools when installed (perf extra).
+        loop="auto",
+        http="auto",
     )
 
 
@@ -5666,3 +5857,8 @@ setInterval(load, 30000);
 
 # Keep the runtime wired to the extracted operator cockpit UI.
 _DASHBOARD_HTML = DASHBOARD_HTML
+
+# Pre-encoded dashboard body, gzipped once at import rather than per request.
+_DASHBOARD_HTML_BYTES = _DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_HTML_GZIP = gzip.compress(_DASHBOARD_HTML_BYTES, 9)
+_DASHBOARD_ETAG = f'"{sha256(_DASHBOARD_HTML_BYTES).hexdigest()[:16]}"'
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import array
+import asyncio
+import functools
 import json
 import logging
+import os
 import re
 import time
 from collections.abc import AsyncIterator, Callable
@@ -12,6 +16,12 @@ from typing import Any
 
 import httpx
 
+try:
+    # Installed via the `perf` extra; stdlib json remains the fallback.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised without the perf extra
+    _orjson = None
+
 from .lane_registry import get_provider_transport_binding
 
 # OAuthBackend is imported lazily in create_provider_backend() to avoid
@@ -21,6 +31,64 @@ OAuthBackend = None
 logger = logging.getLogger("faigate.providers")
 _UNRESOLVED_ENV_RE = re.compile(r"\$\{[^}]+}")
 
+# OpenAI role → Google GenAI role; anything unknown maps to "user".
+_GOOGLE_ROLE_MAP = {"assistant": "model", "user": "user"}
+
+
+@functools.lru_cache(maxsize=128)
+def _google_system_block(text: str) -> dict:
+    """Shared systemInstruction block for a given system prompt.
+
+    Agentic loops reissue the same system prompt dozens of times per session;
+    the cached dict is treated as immutable and only ever serialized.
+    """
+    return {"parts": [{"text": text}]}
+
+
+# One pooled AsyncClient per upstream origin, shared by every provider that
+# talks to it. Providers on the same host (e.g. several OpenRouter lanes)
+# reuse warm TLS connections instead of each holding a private pool.
+_SHARED_CLIENTS: dict[str, httpx.AsyncClient] = {}
+
+
+def _shared_async_client(base_url: str) -> httpx.AsyncClient:
+    """Return the pooled client for ``base_url``'s scheme+host origin."""
+    origin = "/".join(str(base_url).split("/", 3)[:3])
+    client = _SHARED_CLIENTS.get(origin)
+    if client is None or getattr(client, "is_closed", False):
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=int(os.environ.get("FAIGATE_MAX_CONNECTIONS", "100")),
+                max_keepalive_connections=int(os.environ.get("FAIGATE_MAX_KEEPALIVE", "20")),
+            ),
+        )
+        _SHARED_CLIENTS[origin] = client
+    return client
+
+
+async def aclose_shared_clients() -> None:
+    """Close every pooled client. Called once at app shutdown."""
+    clients = list(_SHARED_CLIENTS.values())
+    _SHARED_CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
+
+
+def _dump_json_body(body: dict[str, Any]) -> bytes:
+    """Encode a request body to JSON bytes, bypassing httpx's stdlib encoder."""
+    if _orjson is not None:
+        return _orjson.dumps(body)
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json_response(resp: httpx.Response) -> Any:
+    """Decode a JSON response from raw bytes, skipping the intermediate str."""
+    if _orjson is not None:
+        return _orjson.loads(resp.content)
+    return resp.json()
+
+
 _CODEX_PLAN_TIER_CACHE: str | None = None
 
 
@@ -102,32 +170,46 @@ def create_provider_backend(name: str, cfg: dict) -> ProviderBackend:
     return ProviderBackend(name, cfg)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderHealth:
     """Tracks health state for a single provider."""
 
+    _WINDOW = 20
+
     name: str
     healthy: bool = True
     consecutive_failures: int = 0
     last_check: float = 0.0
     last_error: str = ""
     avg_latency_ms: float = 0.0
-    _latencies: list[float] = field(default_factory=list)
+    # Fixed ring buffer + running sum: O(1) updates with no allocation,
+    # replacing the old append/slice/sum-over-20 moving average.
+    _latencies: array.array = field(default_factory=lambda: array.array("d", [0.0] * 20))
+    _cursor: int = 0
+    _count: int = 0
+    _sum: float = 0.0
+    # to_dict() snapshot, rebuilt only after state changes; health endpoints
+    # and dashboard pollers hit it far more often than requests mutate it.
+    _snapshot: dict | None = None
 
     def record_success(self, latency_ms: float) -> None:
         self.healthy = True
         self.consecutive_failures = 0
         self.last_check = time.time()
         self.last_error = ""
-        self._latencies.append(latency_ms)
-        if len(self._latencies) > 20:
-            self._latencies = self._latencies[-20:]
-        self.avg_latency_ms = sum(self._latencies) / len(self._latencies)
+        self._sum += latency_ms - self._latencies[self._cursor]
+        self._latencies[self._cursor] = latency_ms
+        self._cursor = (self._cursor + 1) % self._WINDOW
+        if self._count < self._WINDOW:
+            self._count += 1
+        self.avg_latency_ms = self._sum / self._count
+        self._snapshot = None
 
     def record_failure(self, error: str, max_failures: int = 3) -> None:
         self.consecutive_failures += 1
         self.last_check = time.time()
         self.last_error = error
+        self._snapshot = None
         if self.consecutive_failures >= max_failures:
             self.healthy = False
             logger.warning(
@@ -138,19 +220,58 @@ class ProviderHealth:
             )
 
     def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "healthy": self.healthy,
-            "consecutive_failures": self.consecutive_failures,
-            "avg_latency_ms": round(self.avg_latency_ms, 1),
-            "last_error": self.last_error,
-        }
+        if self._snapshot is None:
+            self._snapshot = {
+                "name": self.name,
+                "healthy": self.healthy,
+                "consecutive_failures": self.consecutive_failures,
+                "avg_latency_ms": round(self.avg_latency_ms, 1),
+                "last_error": self.last_error,
+            }
+        return self._snapshot
 
 
 class ProviderBackend:
     """Calls an OpenAI-compatible or Google GenAI endpoint."""
 
-    def __init__(self, name: str, cfg: dict):
+    # Slotted: dozens of instances live for the process lifetime and every
+    # request reads several attributes on the hot path. OAuthBackend subclasses
+    # without __slots__, so its extra state still lands in a __dict__.
+    __slots__ = (
+        "name",
+        "cfg",
+        "contract",
+        "backend_type",
+        "base_url",
+        "api_key",
+        "model",
+        "max_tokens",
+        "tier",
+        "capabilities",
+        "context_window",
+        "limits",
+        "cache",
+        "image",
+        "lane",
+        "default_extra_body",
+        "default_extra_headers",
+        "transport",
+        "health",
+        "_last_probe_strategy",
+        "_last_probe_payload",
+        "_last_probe_verified",
+        "_client",
+        "_chat_url",
+        "_models_url",
+        "_image_generation_url",
+        "_image_edit_url",
+        "_headers_cache",
+        "_headers_cache_key",
+        "max_concurrency",
+        "_sem",
+    )
+
+    def __init__(self, name: str, cfg: dict, client: httpx.AsyncClient | None = None):
         self.name = name
         self.cfg = cfg  # stored for OAuthBackend._create_wrapped_backend()
         self.contract = cfg.get("contract", "generic")
@@ -181,13 +302,45 @@ class ProviderBackend:
         self._last_probe_payload = ""
         self._last_probe_verified = False
 
-        self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(120.0, connect=10.0),
-            limits=httpx.Limits(max_connections=20),
+        # Injected clients (tests, custom transports) are caller-owned;
+        # otherwise share the per-origin pool.
+        self._client = client if client is not None else _shared_async_client(self.base_url)
+
+        # Endpoint URLs never change per instance; headers vary only with
+        # api_key (OAuth refresh rebinds it), so they are cached keyed on it.
+        self._chat_url = self._transport_url(self._transport_path("chat_path", "/chat/completions"))
+        self._models_url = self._transport_url(self._transport_path("models_path", "/models"))
+        self._image_generation_url = self._transport_url(
+            self._transport_path("image_generation_path", "/images/generations")
         )
+        self._image_edit_url = self._transport_url(self._transport_path("image_edit_path", "/images/edits"))
+        self._headers_cache: dict[str | None, dict[str, str]] = {}
+        self._headers_cache_key: str | None = None
+
+        # Backpressure: excess calls queue in-process instead of piling up
+        # against the upstream and harvesting 429s that trip the breaker.
+        self.max_concurrency = int(cfg.get("max_concurrency", 64) or 64)
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a concurrency slot."""
+        return self.max_concurrency - self._sem._value  # noqa: SLF001
 
     async def close(self) -> None:
-        await self._client.aclose()
+        """Per-backend cleanup. Shared clients are closed via aclose_shared_clients()."""
+
+    async def prewarm(self, n: int = 2) -> None:
+        """Prime keep-alive connections so the first completion skips TCP+TLS setup.
+
+        Issues ``n`` cheap HEAD requests against the base URL; the responses
+        are irrelevant (404s are fine), only the warmed connections matter.
+        Failures are swallowed — an unreachable provider just stays cold.
+        """
+        await asyncio.gather(
+            *(self._client.head(self.base_url) for _ in range(n)),
+            return_exceptions=True,
+        )
 
     def _transport_path(self, key: str, default: str = "") -> str:
         if key in self.transport:
@@ -201,6 +354,14 @@ class ProviderBackend:
         return f"{self.base_url}{cleaned}"
 
     def _authorization_headers(self, *, content_type: str | None = None) -> dict[str, str]:
+        # Cached per api_key: OAuth backends rebind api_key on token refresh,
+        # so the cache invalidates itself instead of freezing at __init__.
+        if self._headers_cache_key != self.api_key:
+            self._headers_cache.clear()
+            self._headers_cache_key = self.api_key
+        cached = self._headers_cache.get(content_type)
+        if cached is not None:
+            return cached
         headers: dict[str, str] = {}
         auth_mode = str(self.transport.get("auth_mode", "bearer") or "bearer").strip().lower()
         if auth_mode == "bearer" and self.api_key:
@@ -212,6 +373,7 @@ class ProviderBackend:
             headers["X-Title"] = "fusionAIze Gate"
         if self.default_extra_headers:
             headers.update(self.default_extra_headers)
+        self._headers_cache[content_type] = headers
         return headers
 
     def _uses_codex_responses_api(self) -> bool:
@@ -492,7 +654,7 @@ class ProviderBackend:
         t0: float,
     ) -> AsyncIterator[bytes]:
         """Translate Codex responses SSE into OpenAI-compatible chat chunks."""
-        async with self._client.stream("POST", url, json=body, headers=headers) as resp:
+        async with self._client.stream("POST", url, content=_dump_json_body(body), headers=headers) as resp:
             if resp.status_code >= 400:
                 error_text = await resp.aread()
                 self.health.record_failure(f"HTTP {resp.status_code}")
@@ -546,7 +708,7 @@ class ProviderBackend:
                         )
                         emitted_role = True
                     saw_content = True
-                    self.health.record_success((time.time() - t0) * 1000)
+                    self.health.record_success((time.monotonic() - t0) * 1000)
                     yield self._openai_sse_chunk(
                         {
                             "id": completion_id,
@@ -613,7 +775,7 @@ class ProviderBackend:
                             finish_reason = "tool_calls"
                             break
                     if not saw_content:
-                        self.health.record_success((time.time() - t0) * 1000)
+                        self.health.record_success((time.monotonic() - t0) * 1000)
                     yield self._openai_sse_chunk(
                         {
                             "id": completion_id,
@@ -626,7 +788,7 @@ class ProviderBackend:
                     yield b"data: [DONE]\n\n"
                     return
 
-            self.health.record_success((time.time() - t0) * 1000)
+            self.health.record_success((time.monotonic() - t0) * 1000)
             yield self._openai_sse_chunk(
                 {
                     "id": completion_id,
@@ -704,11 +866,11 @@ class ProviderBackend:
         self.health.record_failure(detail)
 
     async def _probe_via_models(self, *, timeout_seconds: float) -> bool:
-        url = self._transport_url(self._transport_path("models_path", "/models"))
+        url = self._models_url
         headers = self._authorization_headers()
-        t0 = time.time()
+        t0 = time.monotonic()
         resp = await self._client.get(url, headers=headers, timeout=timeout_seconds)
-        latency = (time.time() - t0) * 1000
+        latency = (time.monotonic() - t0) * 1000
         if resp.status_code >= 400:
             raise ProviderError(self.name, resp.status_code, resp.text[:500])
         self._mark_probe_success("models", latency)
@@ -724,12 +886,12 @@ class ProviderBackend:
         }
 
     async def _probe_via_chat(self, *, timeout_seconds: float) -> bool:
-        url = self._transport_url(self._transport_path("chat_path", "/chat/completions"))
+        url = self._chat_url
         headers = self._authorization_headers(content_type="application/json")
         body = self._build_chat_probe_body()
-        t0 = time.time()
+        t0 = time.monotonic()
         resp = await self._client.post(url, json=body, headers=headers, timeout=timeout_seconds)
-        latency = (time.time() - t0) * 1000
+        latency = (time.monotonic() - t0) * 1000
         if resp.status_code >= 400:
             raise ProviderError(self.name, resp.status_code, resp.text[:500])
         self._mark_probe_success("chat", latency)
@@ -952,12 +1114,12 @@ class ProviderBackend:
             body.update(extra_body)
 
         headers = self._authorization_headers(content_type="application/json")
-        url = self._transport_url(self._transport_path("image_generation_path", "/images/generations"))
-        t0 = time.time()
+        url = self._image_generation_url
+        t0 = time.monotonic()
 
         try:
             resp = await self._client.post(url, json=body, headers=headers)
-            latency = (time.time() - t0) * 1000
+            latency = (time.monotonic() - t0) * 1000
 
             if resp.status_code >= 400:
                 error_text = resp.text[:500]
@@ -1043,12 +1205,12 @@ class ProviderBackend:
             )
 
         headers = self._authorization_headers()
-        url = self._transport_url(self._transport_path("image_edit_path", "/images/edits"))
-        t0 = time.time()
+        url = self._image_edit_url
+        t0 = time.monotonic()
 
         try:
             resp = await self._client.post(url, data=data, files=files, headers=headers)
-            latency = (time.time() - t0) * 1000
+            latency = (time.monotonic() - t0) * 1000
 
             if resp.status_code >= 400:
                 error_text = resp.text[:500]
@@ -1084,11 +1246,162 @@ class ProviderBackend:
         max_tokens: int | None = None,
         tools: list[dict] | None = None,
         extra_body: dict | None = None,
+    ) -> dict | AsyncIterator[bytes]:
+        """Send a chat completion request, capped at ``max_concurrency`` in flight.
+
+        Returns the full JSON response, or an async byte iterator for streams.
+        Streamed responses hold their concurrency slot until fully consumed.
+        """
+        await self._sem.acquire()
+        streaming = False
+        try:
+            result = await self._complete_uncapped(
+                messages,
+                model_override=model_override,
+                stream=stream,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                tools=tools,
+                extra_body=extra_body,
+            )
+            if hasattr(result, "__aiter__"):
+                streaming = True
+                return self._release_when_drained(result)
+            return result
+        finally:
+            if not streaming:
+                self._sem.release()
+
+    async def _release_when_drained(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Yield ``chunks`` through, releasing the concurrency slot when done."""
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            self._sem.release()
+
+    async def batch_complete(
+        self,
+        batches: list[list[dict]],
+        *,
+        poll_interval: float = 5.0,
+        timeout_seconds: float = 3600.0,
+    ) -> list[dict]:
+        """Complete many conversations, one result per input conversation.
+
+        Providers configured with ``supports_batch_api: true`` get a single
+        server-side batch job (OpenAI-style /files + /batches, half price on
+        OpenAI); everyone else falls back to concurrent complete() calls
+        bounded by the provider's semaphore. Results keep input order.
+        """
+        if not batches:
+            return []
+        if self.backend_type == "openai-compat" and bool(self.cfg.get("supports_batch_api")):
+            return await self._batch_complete_native(
+                batches,
+                poll_interval=poll_interval,
+                timeout_seconds=timeout_seconds,
+            )
+        results = await asyncio.gather(*(self.complete(messages) for messages in batches))
+        return list(results)
+
+    async def _batch_complete_native(
+        self,
+        batches: list[list[dict]],
+        *,
+        poll_interval: float,
+        timeout_seconds: float,
+    ) -> list[dict]:
+        """Run one OpenAI-style batch job: upload JSONL, poll, collect output."""
+        headers = self._authorization_headers()
+        files_url = self._transport_url(self._transport_path("files_path", "/files"))
+        batches_url = self._transport_url(self._transport_path("batches_path", "/batches"))
+
+        lines = []
+        for i, messages in enumerate(batches):
+            lines.append(
+                _dump_json_body(
+                    {
+                        "custom_id": str(i),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.model,
+                            "messages": messages,
+                            "max_tokens": self.max_tokens,
+                        },
+                    }
+                )
+            )
+
+        resp = await self._client.post(
+            files_url,
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", b"\n".join(lines), "application/jsonl")},
+            headers=headers,
+        )
+        if resp.status_code >= 400:
+            raise ProviderError(self.name, resp.status_code, resp.text[:500])
+        input_file_id = _load_json_response(resp)["id"]
+
+        resp = await self._client.post(
+            batches_url,
+            content=_dump_json_body(
+                {
+                    "input_file_id": input_file_id,
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h",
+                }
+            ),
+            headers=self._authorization_headers(content_type="application/json"),
+        )
+        if resp.status_code >= 400:
+            raise ProviderError(self.name, resp.status_code, resp.text[:500])
+        batch = _load_json_response(resp)
+        batch_id = batch["id"]
+
+        deadline = time.monotonic() + timeout_seconds
+        while batch.get("status") not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() >= deadline:
+                raise ProviderError(self.name, 0, f"Batch {batch_id} timed out after {timeout_seconds:.0f}s")
+            await asyncio.sleep(poll_interval)
+            resp = await self._client.get(f"{batches_url}/{batch_id}", headers=headers)
+            if resp.status_code >= 400:
+                raise ProviderError(self.name, resp.status_code, resp.text[:500])
+            batch = _load_json_response(resp)
+
+        if batch.get("status") != "completed":
+            raise ProviderError(self.name, 0, f"Batch {batch_id} ended with status {batch.get('status')!r}")
+
+        resp = await self._client.get(f"{files_url}/{batch.get('output_file_id')}/content", headers=headers)
+        if resp.status_code >= 400:
+            raise ProviderError(self.name, resp.status_code, resp.text[:500])
+
+        results: list[dict] = [{} for _ in batches]
+        for raw_line in resp.content.splitlines():
+            if not raw_line.strip():
+                continue
+            item = _orjson.loads(raw_line) if _orjson is not None else json.loads(raw_line)
+            idx = int(item.get("custom_id", -1))
+            if 0 <= idx < len(results):
+                results[idx] = (item.get("response") or {}).get("body") or {}
+        return results
+
+    async def _complete_uncapped(
+        self,
+        messages: list[dict],
+        *,
+        model_override: str | None = None,
+        stream: bool = False,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        tools: list[dict] | None = None,
+        extra_body: dict | None = None,
     ) -> dict | AsyncIterator[bytes]:
         """Send a chat completion request. Returns the full JSON response."""
 
         model = model_override or self.model
-        t0 = time.time()
+        t0 = time.monotonic()
 
         if self.backend_type == "google-genai":
             return await self._complete_google(
@@ -1117,7 +1430,7 @@ class ProviderBackend:
                 extra_body=extra_body,
             )
             headers = self._authorization_headers(content_type="application/json")
-            url = self._transport_url(self._transport_path("chat_path", "/chat/completions"))
+            url = self._chat_url
             try:
                 if stream:
                     return self._stream_codex_response(
@@ -1128,8 +1441,8 @@ class ProviderBackend:
                         t0=t0,
                     )
 
-                resp = await self._client.post(url, json=body, headers=headers)
-                latency = (time.time() - t0) * 1000
+                resp = await self._client.post(url, content=_dump_json_body(body), headers=headers)
+                latency = (time.monotonic() - t0) * 1000
                 if resp.status_code >= 400:
                     error_text = resp.text[:500]
                     self.health.record_failure(f"HTTP {resp.status_code}: {error_text}")
@@ -1191,14 +1504,14 @@ class ProviderBackend:
             body.update(extra_body)
 
         headers = self._authorization_headers(content_type="application/json")
-        url = self._transport_url(self._transport_path("chat_path", "/chat/completions"))
+        url = self._chat_url
 
         try:
             if stream:
                 return self._stream_response(url, headers, body, t0)
 
-            resp = await self._client.post(url, json=body, headers=headers)
-            latency = (time.time() - t0) * 1000
+            resp = await self._client.post(url, content=_dump_json_body(body), headers=headers)
+            latency = (time.monotonic() - t0) * 1000
 
             if resp.status_code >= 400:
                 error_text = resp.text[:500]
@@ -1206,7 +1519,7 @@ class ProviderBackend:
                 raise ProviderError(self.name, resp.status_code, error_text)
 
             self.health.record_success(latency)
-            data = resp.json()
+            data = _load_json_response(resp)
 
             # Passive quota signal: mine rate-limit headers into the catalog.
             # No-op for providers without recognised headers; never raises.
@@ -1241,7 +1554,7 @@ class ProviderBackend:
 
     async def _stream_response(self, url: str, headers: dict, body: dict, t0: float) -> AsyncIterator[bytes]:
         """Yield SSE chunks for streaming responses."""
-        async with self._client.stream("POST", url, json=body, headers=headers) as resp:
+        async with self._client.stream("POST", url, content=_dump_json_body(body), headers=headers) as resp:
             if resp.status_code >= 400:
                 error_text = await resp.aread()
                 self.health.record_failure(f"HTTP {resp.status_code}")
@@ -1249,11 +1562,13 @@ class ProviderBackend:
 
             first_chunk = True
             try:
-                async for line in resp.aiter_lines():
+                # The upstream already speaks OpenAI SSE, so forward its bytes
+                # untouched instead of line-decoding and re-encoding each chunk.
+                async for chunk in resp.aiter_bytes():
                     if first_chunk:
-                        self.health.record_success((time.time() - t0) * 1000)
+                        self.health.record_success((time.monotonic() - t0) * 1000)
                         first_chunk = False
-                    yield (line + "\n").encode()
+                    yield chunk
             except httpx.HTTPError as e:
                 self.health.record_failure(f"Stream error: {e}")
                 raise ProviderError(self.name, 0, f"Stream error: {e}") from e
@@ -1278,6 +1593,7 @@ class ProviderBackend:
         # coerce content=None (valid in OpenAI tool/assistant messages) → "".
         contents = []
         system_instruction = None
+        append = contents.append  # hoist for long conversations
         for msg in messages:
             role = msg.get("role", "user")
             text = msg.get("content") or ""  # coerce None → ""
@@ -1286,14 +1602,12 @@ class ProviderBackend:
                 text = " ".join(part.get("text") or "" for part in text if isinstance(part, dict))
             if role == "system":
                 system_instruction = text
-            elif role == "assistant":
-                contents.append({"role": "model", "parts": [{"text": text}]})
             else:
-                contents.append({"role": "user", "parts": [{"text": text}]})
+                append({"role": _GOOGLE_ROLE_MAP.get(role, "user"), "parts": [{"text": text}]})
 
         body: dict[str, Any] = {"contents": contents}
         if system_instruction:
-            body["systemInstruction"] = {"parts": [{"text": system_instruction}]}
+            body["systemInstruction"] = _google_system_block(system_instruction)
 
         gen_config: dict[str, Any] = {}
         if max_tokens:
@@ -1304,11 +1618,15 @@ class ProviderBackend:
             body["generationConfig"] = gen_config
 
         url = f"{self.base_url}/models/{model}:generateContent?key={self.api_key}"
-        t0 = time.time()
+        t0 = time.monotonic()
 
         try:
-            resp = await self._client.post(url, json=body)
-            latency = (time.time() - t0) * 1000
+            resp = await self._client.post(
+                url,
+                content=_dump_json_body(body),
+                headers={"Content-Type": "application/json"},
+            )
+            latency = (time.monotonic() - t0) * 1000
 
             if resp.status_code >= 400:
                 error_text = resp.text[:500]
@@ -1316,7 +1634,7 @@ class ProviderBackend:
                 raise ProviderError(self.name, resp.status_code, error_text)
 
             self.health.record_success(latency)
-            google_data = resp.json()
+            google_data = _load_json_response(resp)
 
             # Convert Google response → OpenAI format
             return self._google_to_openai(google_data, model, latency)
@@ -1344,6 +1662,7 @@ class ProviderBackend:
         # Build Gemini-format contents from OpenAI messages
         contents = []
         system_instruction = None
+        append = contents.append
         for msg in messages:
             role = msg.get("role", "user")
             text = msg.get("content") or ""
@@ -1351,14 +1670,12 @@ class ProviderBackend:
                 text = " ".join(part.get("text") or "" for part in text if isinstance(part, dict))
             if role == "system":
                 system_instruction = text
-            elif role == "assistant":
-                contents.append({"role": "model", "parts": [{"text": text}]})
             else:
-                contents.append({"role": "user", "parts": [{"text": text}]})
+                append({"role": _GOOGLE_ROLE_MAP.get(role, "user"), "parts": [{"text": text}]})
 
         gemini_request: dict[str, Any] = {"contents": contents}
         if system_instruction:
-            gemini_request["systemInstruction"] = {"parts": [{"text": system_instruction}]}
+            gemini_request["systemInstruction"] = _google_system_block(system_instruction)
         gen_config: dict[str, Any] = {}
         if max_tokens:
             gen_config["maxOutputTokens"] = max_tokens
@@ -1377,11 +1694,11 @@ class ProviderBackend:
 
         headers = self._authorization_headers(content_type="application/json")
         url = f"{self.base_url}:generateContent"
-        t0 = time.time()
+        t0 = time.monotonic()
 
         try:
-            resp = await self._client.post(url, json=body, headers=headers)
-            latency = (time.time() - t0) * 1000
+            resp = await self._client.post(url, content=_dump_json_body(body), headers=headers)
+            latency = (time.monotonic() - t0) * 1000
 
             if resp.status_code >= 400:
                 error_text = resp.text[:500]
@@ -1390,7 +1707,7 @@ class ProviderBackend:
 
             self.health.record_success(latency)
             # cloudcode-pa wraps response: {"response": <gemini_response>}
-            outer = resp.json()
+            outer = _load_json_response(resp)
             google_data = outer.get("response", outer)
             return self._google_to_openai(google_data, model, latency)
 
@@ -1408,11 +1725,12 @@ class ProviderBackend:
 
         usage_meta = data.get("usageMetadata", {})
         cached = usage_meta.get("cachedContentTokenCount", 0)
+        now = int(time.time())
 
         return {
-            "id": f"faigate-google-{int(time.time())}",
+            "id": f"faigate-google-{now}",
             "object": "chat.completion",
-            "created": int(time.time()),
+            "created": now,
             "model": model,
             "choices": [
                 {
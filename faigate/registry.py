@@ -30,8 +30,14 @@ The registry is consumed by:
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TypedDict
 
+# Shared read-only zero-cost pricing. Roughly twenty gateway/local/OAuth
+# entries carry identical {"input": 0.0, "output": 0.0} dicts; one frozen
+# instance backs them all. Consumers copy before mutating (they already do).
+_ZERO_PRICING = MappingProxyType({"input": 0.0, "output": 0.0})
+
 
 class ProviderDef(TypedDict, total=False):
     backend: str  # "openai-compat" | "anthropic-compat" | "google-genai"
@@ -83,7 +89,7 @@ BUILTIN: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="default",
         example_model="openai-codex/gpt-5.4",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes=(
             "OpenAI Codex (ChatGPT OAuth) – token from ~/.codex/auth.json. "
             "Inference via chatgpt.com/backend-api/codex/responses. "
@@ -98,7 +104,7 @@ BUILTIN: dict[str, ProviderDef] = {
         api_key_env="OPENCODE_API_KEY",
         tier="default",
         example_model="opencode/claude-opus-4-6",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="OpenCode Zen – Anthropic-compatible gateway",
     ),
     # ── Google Gemini (API key) ────────────────────────────────────────────
@@ -121,7 +127,7 @@ BUILTIN: dict[str, ProviderDef] = {
         api_key_env="ZAI_API_KEY",
         tier="default",
         example_model="glm-4.7",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Z.AI / GLM models (aliases: z.ai/*, z-ai/*)",
     ),
     # ── Vercel AI Gateway ─────────────────────────────────────────────────
@@ -132,7 +138,7 @@ BUILTIN: dict[str, ProviderDef] = {
         api_key_env="AI_GATEWAY_API_KEY",
         tier="fallback",
         example_model="vercel-ai-gateway/anthropic/claude-opus-4.6",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Vercel AI Gateway – multi-model proxy",
     ),
     # ── Kilo Gateway ──────────────────────────────────────────────────────
@@ -143,7 +149,7 @@ BUILTIN: dict[str, ProviderDef] = {
         api_key_env="KILOCODE_API_KEY",
         tier="fallback",
         example_model="kilocode/anthropic/claude-opus-4.6",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Kilo Gateway – expanded catalog incl. GLM-5, MiniMax, Kimi K2.5",
     ),
     # ── OpenRouter ────────────────────────────────────────────────────────
@@ -212,7 +218,7 @@ BUILTIN: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="default",
         example_model="gpt-4o",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="GitHub Copilot – requires GH_TOKEN / COPILOT_GITHUB_TOKEN",
     ),
     # ── Hugging Face Inference ────────────────────────────────────────────
@@ -224,7 +230,7 @@ BUILTIN: dict[str, ProviderDef] = {
         api_key_env_alt="HF_TOKEN",
         tier="default",
         example_model="huggingface/deepseek-ai/DeepSeek-R1",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="HuggingFace Inference – OpenAI-compat router",
     ),
     # ── DeepSeek ──────────────────────────────────────────────────────────
@@ -323,7 +329,7 @@ BUILTIN: dict[str, ProviderDef] = {
         api_key_env="NVIDIA_API_KEY",
         tier="default",
         example_model="nvidia-nim/deepseek-ai/deepseek-r1",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="NVIDIA NIM – optimized inference on NVIDIA infra, DeepSeek / Llama / Mistral",
     ),
 }
@@ -342,7 +348,7 @@ CUSTOM: dict[str, ProviderDef] = {
         api_key_env="MOONSHOT_API_KEY",
         tier="default",
         example_model="moonshot/kimi-k2.5",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes=(
             "Moonshot AI / Kimi – OpenAI-compat; models: kimi-k2.5, kimi-k2-0905-preview,"
             " kimi-k2-turbo-preview, kimi-k2-thinking, kimi-k2-thinking-turbo"
@@ -357,7 +363,7 @@ CUSTOM: dict[str, ProviderDef] = {
         api_key_env="KIMI_API_KEY",
         tier="default",
         example_model="kimi-coding/k2p5",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Kimi Coding – Anthropic-compat endpoint via Moonshot",
     ),
     # ── Volcano Engine / Doubao (China) ───────────────────────────────────
@@ -368,7 +374,7 @@ CUSTOM: dict[str, ProviderDef] = {
         api_key_env="VOLCANO_ENGINE_API_KEY",
         tier="default",
         example_model="volcengine/doubao-seed-1-8-251228",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Volcano Engine – Doubao, Kimi K2.5, GLM 4.7, DeepSeek V3.2 (CN)",
     ),
     # ── Volcano Engine plan (coding models) ───────────────────────────────
@@ -379,7 +385,7 @@ CUSTOM: dict[str, ProviderDef] = {
         api_key_env="VOLCANO_ENGINE_API_KEY",
         tier="default",
         example_model="volcengine-plan/ark-code-latest",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes=(
             "Volcano Engine – coding models (ark-code-latest, doubao-seed-code, kimi-k2.5, kimi-k2-thinking, glm-4.7)"
         ),
@@ -392,7 +398,7 @@ CUSTOM: dict[str, ProviderDef] = {
         api_key_env="BYTEPLUS_API_KEY",
         tier="default",
         example_model="byteplus/seed-1-8-251228",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="BytePlus ARK – international access to Volcano Engine models",
     ),
     # ── BytePlus plan (coding models) ─────────────────────────────────────
@@ -403,7 +409,7 @@ CUSTOM: dict[str, ProviderDef] = {
         api_key_env="BYTEPLUS_API_KEY",
         tier="default",
         example_model="byteplus-plan/ark-code-latest",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes=(
             "BytePlus ARK – coding models (ark-code-latest, doubao-seed-code, kimi-k2.5, kimi-k2-thinking, glm-4.7)"
         ),
@@ -416,7 +422,7 @@ CUSTOM: dict[str, ProviderDef] = {
         api_key_env="SYNTHETIC_API_KEY",
         tier="default",
         example_model="synthetic/hf:MiniMaxAI/MiniMax-M2.1",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Synthetic – Anthropic-compat; exposes HuggingFace models (MiniMax, etc.)",
     ),
     # ── MiniMax ───────────────────────────────────────────────────────────
@@ -427,7 +433,7 @@ CUSTOM: dict[str, ProviderDef] = {
         api_key_env="MINIMAX_API_KEY",
         tier="default",
         example_model="minimax/MiniMax-M2.1",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="MiniMax – Anthropic-compat custom endpoint",
     ),
     # ── Qwen (Alibaba Cloud) ──────────────────────────────────────────────
@@ -438,7 +444,7 @@ CUSTOM: dict[str, ProviderDef] = {
         api_key_env="QWEN_API_KEY",
         tier="default",
         example_model="qwen/qwen3.6-plus",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Qwen models via Alibaba Cloud – OpenAI-compatible endpoint",
     ),
 }
@@ -458,7 +464,7 @@ LOCAL: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="local",
         example_model="ollama/llama3.3",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Ollama – local LLM runtime, OpenAI-compat at :11434",
     ),
     # ── vLLM ──────────────────────────────────────────────────────────────
@@ -470,7 +476,7 @@ LOCAL: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="local",
         example_model="vllm/your-model-id",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="vLLM – local/self-hosted OpenAI-compat server at :8000",
     ),
     # ── LM Studio ─────────────────────────────────────────────────────────
@@ -482,7 +488,7 @@ LOCAL: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="local",
         example_model="lmstudio/minimax-m2.1-gs32",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="LM Studio – local OpenAI-compat server at :1234",
     ),
     # ── LiteLLM proxy ─────────────────────────────────────────────────────
@@ -494,7 +500,7 @@ LOCAL: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="local",
         example_model="litellm/your-model-id",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="LiteLLM proxy – OpenAI-compat gateway to 100+ providers at :4000",
     ),
 }
@@ -516,7 +522,7 @@ OAUTH: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="mid",
         example_model="gc/gemini-2.5-pro",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Google Gemini via Vertex AI – uses gcloud ADC; requires: gcloud auth login",
     ),
     # ── Qwen OAuth (free tier via qwen-code CLI) ──────────────────────────
@@ -528,7 +534,7 @@ OAUTH: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="default",
         example_model="coder-model",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Qwen OAuth (free tier) – reads token from ~/.qwen/oauth_creds.json; run: qwen auth login",
     ),
     # ── Claude Code (OAuth via Anthropic) ──────────────────────────────────
@@ -540,7 +546,7 @@ OAUTH: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="default",
         example_model="claude-code",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes="Claude Code – special coding model via Anthropic OAuth",
     ),
     # ── Google Antigravity (Google OAuth – Generative Language API) ────────
@@ -557,7 +563,7 @@ OAUTH: dict[str, ProviderDef] = {
         auth_optional=True,
         tier="default",
         example_model="gemini-2.5-pro",
-        pricing={"input": 0.0, "output": 0.0},
+        pricing=_ZERO_PRICING,
         notes=(
             "Google Antigravity – Google OAuth (client_id: 1071006060591-...apps.googleusercontent.com); "
             "token from ~/.gemini/oauth_creds.json. Antigravity's local gRPC LS (127.0.0.1:<ephemeral-port>) "
@@ -572,7 +578,16 @@ OAUTH: dict[str, ProviderDef] = {
 # Combined registry
 # ---------------------------------------------------------------------------
 
-ALL: dict[str, ProviderDef] = {**BUILTIN, **CUSTOM, **LOCAL, **OAUTH}
+# Read-only view: the registry is import-time static, and an immutable ALL
+# lets consumers hold references without defensive copies.
+ALL: MappingProxyType[str, ProviderDef] = MappingProxyType({**BUILTIN, **CUSTOM, **LOCAL, **OAUTH})
+
+# Flattened lookup tables so the per-request helpers below cost a single
+# dict/set probe instead of two chained .get() calls.
+_API_KEY_ENV: dict[str, str] = {
+    name: str(entry["api_key_env"]) for name, entry in ALL.items() if entry.get("api_key_env")
+}
+_AUTH_OPTIONAL: frozenset[str] = frozenset(name for name, entry in ALL.items() if entry.get("auth_optional"))
 
 
 def get(name: str) -> ProviderDef | None:
@@ -587,15 +602,9 @@ def known_names() -> list[str]:
 
 def api_key_env(name: str) -> str | None:
     """Return the primary API key env var name for a provider, or None."""
-    entry = ALL.get(name)
-    if entry is None:
-        return None
-    return entry.get("api_key_env")
+    return _API_KEY_ENV.get(name)
 
 
 def is_auth_optional(name: str) -> bool:
     """Return True if the provider works without an explicit API key."""
-    entry = ALL.get(name)
-    if entry is None:
-        return False
-    return bool(entry.get("auth_optional", False))
+    return name in _AUTH_OPTIONAL
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Any
 
+from ._keyword_scan import KeywordScanner
 from .config import Config
 from .lane_registry import get_canonical_model_catalog, get_canonical_model_routes
 from .provider_catalog import _get_packages_for_provider, _get_pricing_for_provider_and_model
@@ -506,7 +509,7 @@ _FALLBACK_RELATION_WEIGHTS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingDecision:
     """Result of the routing process."""
 
@@ -525,13 +528,20 @@ class RoutingDecision:
             "rule": self.rule_name,
             "confidence": self.confidence,
             "reason": self.reason,
-            "elapsed_ms": round(self.elapsed_ms, 2),
+            # Truncate to 2 decimals without builtins.round — this runs on
+            # every request for logging/metrics and precision is cosmetic.
+            "elapsed_ms": int(self.elapsed_ms * 100) / 100.0,
         }
         if self.details:
             payload["details"] = self.details
         return payload
 
 
+def _elapsed_ms(t0_ns: int) -> float:
+    """Milliseconds since a ``time.perf_counter_ns()`` reference point."""
+    return (time.perf_counter_ns() - t0_ns) / 1_000_000
+
+
 def _estimate_tokens(text: str) -> int:
     """Rough token estimate: ~4 chars per token for mixed en/de text."""
     return max(1, len(text) // 4)
@@ -1009,27 +1019,51 @@ def _merge_select_constraints(*selects: dict[str, Any]) -> dict[str, Any]:
     return merged
 
 
-def _extract_text(messages: list[dict]) -> tuple[str, str, str]:
-    """Extract system prompt, last user message, and full conversation text.
+def _extract_text(messages: list[dict]) -> tuple[str, str, list[str]]:
+    """Extract system prompt, last user message, and per-message content parts.
+
+    The parts are returned unjoined: token estimation only needs their total
+    length, and the joined conversation text is materialized lazily by
+    ``_RoutingContext.full_text`` for the few paths that consume it.
 
     Handles content=None (valid in OpenAI tool/assistant messages) by treating
     it as an empty string so downstream str operations never receive NoneType.
     """
-    system = ""
-    last_user = ""
     full = []
+    append = full.append
     for msg in messages:
-        role = msg.get("role", "")
         content = msg.get("content") or ""  # coerce None → ""
-        if isinstance(content, list):
-            # Handle multimodal content arrays; parts may also have None text
-            content = " ".join(p.get("text") or "" for p in content if isinstance(p, dict))
-        if role == "system":
-            system = content
-        elif role == "user":
-            last_user = content
-        full.append(content)
-    return system, last_user, "\n".join(full)
+        if type(content) is list:  # exact check: JSON-decoded bodies only ever carry plain lists
+            # Handle multimodal content arrays; parts may also have None text.
+            # EAFP fast path: parts are dicts in any well-formed payload, so
+            # skip the per-part isinstance and only re-join defensively if a
+            # malformed part sneaks in.
+            try:
+                content = " ".join(p.get("text") or "" for p in content)
+            except AttributeError:
+                content = " ".join(p.get("text") or "" for p in content if isinstance(p, dict))
+        append(content)
+
+    # Walk backwards for the role probes so the common shape (system first,
+    # user last) finds the user message immediately; the last message of each
+    # role wins, same as the forward overwrite this replaces.
+    system = ""
+    last_user = ""
+    found_system = False
+    found_user = False
+    for i in range(len(messages) - 1, -1, -1):
+        role = messages[i].get("role", "")
+        if not found_user and role == "user":
+            last_user = full[i]
+            found_user = True
+            if found_system:
+                break
+        elif not found_system and role == "system":
+            system = full[i]
+            found_system = True
+            if found_user:
+                break
+    return system, last_user, full
 
 
 def _parse_image_size_max_side(value: str) -> int:
@@ -1056,19 +1090,183 @@ def _normalize_routing_posture(value: str) -> str:
     return "balanced"
 
 
-def _keyword_matches_text(keyword: str, search_text: str) -> bool:
+@functools.lru_cache(maxsize=1024)
+def _compile_keyword(keyword: str) -> tuple[str, re.Pattern | None]:
+    """Normalize a rule keyword once; return ``(lowered, boundary_pattern)``.
+
+    The pattern is ``None`` for keywords with no alphanumeric characters,
+    which match by plain substring. Keywords come from the rule config, so
+    the cache stabilizes after the first request and the per-request cost
+    of ``strip``/``lower``/``re.escape`` drops to a dict lookup.
+    """
     normalized = str(keyword or "").strip().lower()
-    if not normalized:
-        return False
-    if not _BOUNDARY_TEXT_RE.search(normalized):
-        return normalized in search_text
+    if not normalized or not _BOUNDARY_TEXT_RE.search(normalized):
+        return normalized, None
 
     pattern = re.escape(normalized)
     if _BOUNDARY_TEXT_RE.match(normalized[0]):
         pattern = rf"(?<![a-z0-9]){pattern}"
     if _BOUNDARY_TEXT_RE.match(normalized[-1]):
         pattern = rf"{pattern}(?![a-z0-9])"
-    return re.search(pattern, search_text) is not None
+    return normalized, re.compile(pattern)
+
+
+def _keyword_matches_text(keyword: str, search_text: str) -> bool:
+    normalized, pattern = _compile_keyword(keyword)
+    if not normalized:
+        return False
+    if pattern is None:
+        return normalized in search_text
+    return pattern.search(search_text) is not None
+
+
+# Sticky prefix→provider affinity for the fallback layer. Providers keep
+# their own prompt caches, so spreading the same shared prefix across the
+# chain re-pays the prefill on every hop; keeping it on one provider does not.
+_PREFIX_AFFINITY_CAP = 4096
+_PREFIX_AFFINITY_TTL_S = 300.0
+
+
+class PrefixIndex:
+    """Block-hash index of which providers hold which prompt prefixes warm.
+
+    Prompt text is hashed in chained blocks of roughly 256 estimated tokens.
+    Marking a successful completion records every prefix block for its
+    provider; routing can then ask which candidate holds the longest warm
+    prefix of a new prompt. Because block hashes chain, a continued
+    conversation shares all leading blocks with its earlier turns.
+    """
+
+    _BLOCK_CHARS = 1024  # ≈256 tokens at the ~4 chars/token estimate
+
+    def __init__(self, capacity: int = 8192):
+        self._capacity = capacity
+        self._blocks: OrderedDict[int, set[str]] = OrderedDict()
+
+    def mark(self, text: str, provider: str) -> None:
+        """Record that ``provider`` has served (and likely cached) ``text``."""
+        if not text:
+            return
+        chained = 0
+        for i in range(0, len(text), self._BLOCK_CHARS):
+            chained = hash((chained, text[i : i + self._BLOCK_CHARS]))
+            providers = self._blocks.get(chained)
+            if providers is None:
+                providers = set()
+                self._blocks[chained] = providers
+            providers.add(provider)
+            self._blocks.move_to_end(chained)
+        while len(self._blocks) > self._capacity:
+            self._blocks.popitem(last=False)
+
+    def warm_blocks(self, text: str, provider: str) -> int:
+        """Return how many leading blocks of ``text`` are warm on ``provider``."""
+        count = 0
+        chained = 0
+        for i in range(0, len(text), self._BLOCK_CHARS):
+            chained = hash((chained, text[i : i + self._BLOCK_CHARS]))
+            providers = self._blocks.get(chained)
+            if not providers or provider not in providers:
+                break
+            count += 1
+        return count
+
+    def best_provider(self, text: str, candidates: list[str]) -> tuple[str | None, int]:
+        """Return the candidate with the deepest warm prefix, with its depth."""
+        best: str | None = None
+        best_depth = 0
+        for candidate in candidates:
+            depth = self.warm_blocks(text, candidate)
+            if depth > best_depth:
+                best, best_depth = candidate, depth
+        return best, best_depth
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledMatch:
+    """A static match block with every pattern pre-lowercased.
+
+    Built once at startup so the per-request path is pure substring checks —
+    no ``str.lower()`` on config-sourced patterns in the hot loop. ``any_blocks``
+    holds the sub-blocks of an ``any`` compound; when present the other fields
+    are empty and at least one sub-block must match.
+    """
+
+    model_patterns: tuple[str, ...] = ()
+    model_exact: frozenset[str] = frozenset()
+    system_keywords: tuple[str, ...] = ()
+    header_map: tuple[tuple[str, tuple[str, ...]], ...] = ()
+    any_blocks: tuple[_CompiledMatch, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledRule:
+    """One static routing rule, normalized once in ``Router.__init__``."""
+
+    name: str
+    route_to: str
+    match: _CompiledMatch
+    required_fields: int = 0
+    reason: str = ""
+
+
+# Request-field bits for _CompiledRule.required_fields: a rule whose mask
+# demands a field the request doesn't carry can be skipped without entering
+# the matcher at all.
+_FIELD_MODEL = 1
+_FIELD_SYSTEM = 2
+_FIELD_HEADERS = 4
+
+
+def _required_fields(block: _CompiledMatch) -> int:
+    """Bitmask of request fields a block needs to stand any chance of matching.
+
+    Plain blocks require every present condition's field; ``any`` compounds
+    only require the fields demanded by all of their branches (the sound
+    conservative intersection).
+    """
+    if block.any_blocks:
+        mask = _FIELD_MODEL | _FIELD_SYSTEM | _FIELD_HEADERS
+        for sub in block.any_blocks:
+            mask &= _required_fields(sub)
+        return mask
+    mask = 0
+    if block.model_patterns:
+        mask |= _FIELD_MODEL
+    if block.system_keywords:
+        mask |= _FIELD_SYSTEM
+    if block.header_map:
+        mask |= _FIELD_HEADERS
+    return mask
+
+
+def _compile_static_match(match: dict) -> _CompiledMatch:
+    if "any" in match:
+        return _CompiledMatch(any_blocks=tuple(_compile_static_match(sub) for sub in match["any"]))
+    patterns = match.get("model_requested", ())
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    model_patterns = tuple(str(p).lower() for p in patterns)
+    return _CompiledMatch(
+        model_patterns=model_patterns,
+        model_exact=frozenset(model_patterns),
+        system_keywords=tuple(str(kw).lower() for kw in match.get("system_prompt_contains", ())),
+        header_map=tuple(
+            (header_name, tuple(str(p).lower() for p in header_patterns))
+            for header_name, header_patterns in match.get("header_contains", {}).items()
+        ),
+    )
+
+
+def _compile_static_rule(rule: dict) -> _CompiledRule:
+    compiled = _compile_static_match(rule.get("match", {}))
+    return _CompiledRule(
+        name=rule["name"],
+        route_to=rule["route_to"],
+        match=compiled,
+        required_fields=_required_fields(compiled),
+        reason=f"Static rule '{rule['name']}' matched",
+    )
 
 
 class Router:
@@ -1076,10 +1274,118 @@ class Router:
 
     def __init__(self, config: Config):
         self.config = config
+        self._prefix_affinity: OrderedDict[int, tuple[str, float]] = OrderedDict()
+        self.prefix_index = PrefixIndex()
+        static_cfg = config.static_rules
+        self._static_compiled: tuple[_CompiledRule, ...] = (
+            tuple(_compile_static_rule(rule) for rule in static_cfg.get("rules", []))
+            if static_cfg.get("enabled")
+            else ()
+        )
+        # One scanner over every heuristic rule keyword plus the opencode
+        # complexity hints: the heuristic layer resolves all keyword hits
+        # once per request instead of once per keyword per rule.
+        vocab: set[str] = set(_OPENCODE_COMPLEXITY_HINTS)
+        for rule in config.heuristic_rules.get("rules", []):
+            kw_cfg = (rule.get("match") or {}).get("message_keywords") or {}
+            for kw in kw_cfg.get("any_of", []):
+                normalized = str(kw).strip().lower()
+                if normalized:
+                    vocab.add(normalized)
+        self._keyword_vocab: frozenset[str] = frozenset(vocab)
+        self._keyword_scanner = KeywordScanner(vocab)
+        # Flattened hot-path config reads: these dict chains are walked on
+        # every routed request and the config never changes after load.
+        heuristic_cfg = config.heuristic_rules
+        self._heuristic_enabled = bool(heuristic_cfg.get("enabled"))
+        self._heuristic_rules: tuple[tuple[dict[str, Any], str, bool], ...] = tuple(
+            (
+                rule,
+                f"Heuristic rule '{rule.get('name', '')}' matched",
+                bool((rule.get("match") or {}).get("fallthrough")),
+            )
+            for rule in heuristic_cfg.get("rules", [])
+        )
+        llm_cfg = config.llm_classifier
+        self._llm_enabled = bool(llm_cfg.get("enabled"))
+        self._llm_prompt_template = llm_cfg.get("prompt", "")
+        # Keys normalized once so the classifier reply can be looked up
+        # directly, and mixed-case config keys can't silently never match.
+        self._llm_category_routing: dict[str, str] = {
+            str(category).strip().upper(): route for category, route in llm_cfg.get("category_routing", {}).items()
+        }
+        self._fallback_chain: list[str] = config.fallback_chain
+        self._fallback_first = self._fallback_chain[0] if self._fallback_chain else "deepseek-chat"
+        self._fallback_providers: tuple[tuple[str, dict[str, Any]], ...] = tuple(
+            (name, config.provider(name) or {}) for name in self._fallback_chain
+        )
+
+    # ── Prefix-cache affinity ──────────────────────────────────
+
+    def note_completion(self, messages: list[dict], provider_name: str) -> None:
+        """Record a successful completion so the prefix index learns locality."""
+        _, _, parts = _extract_text(messages)
+        self.prefix_index.mark("\n".join(parts), provider_name)
+
+    def _provider_usable(self, provider: str, ctx: _RoutingContext) -> bool:
+        """Healthy, not in hard cooldown, and fits the request dimensions."""
+        if not ctx.provider_health.get(provider, {}).get("healthy", True):
+            return False
+        blocked, _ = self._provider_in_hard_cooldown(provider, ctx)
+        if blocked:
+            return False
+        return self._provider_fits_request_dimensions(provider, self.config.provider(provider) or {}, ctx)
+
+    def _affinity_provider(self, ctx: _RoutingContext) -> str | None:
+        """Return the provider this prompt prefix last routed to, if still usable."""
+        if not ctx.system_prompt:
+            return None
+        entry = self._prefix_affinity.get(hash(ctx.system_prompt))
+        if entry is None:
+            return None
+        provider, stamp = entry
+        if time.time() - stamp > _PREFIX_AFFINITY_TTL_S:
+            del self._prefix_affinity[hash(ctx.system_prompt)]
+            return None
+        if not self._provider_usable(provider, ctx):
+            return None
+        return provider
+
+    def _remember_affinity(self, ctx: _RoutingContext, provider: str) -> None:
+        """Record which provider served this prompt prefix (LRU, capped)."""
+        if not ctx.system_prompt:
+            return
+        key = hash(ctx.system_prompt)
+        self._prefix_affinity[key] = (provider, time.time())
+        self._prefix_affinity.move_to_end(key)
+        if len(self._prefix_affinity) > _PREFIX_AFFINITY_CAP:
+            self._prefix_affinity.popitem(last=False)
 
     # ── Public entry point ─────────────────────────────────────
 
-    async def route(
+    async def route(self, messages: list[dict], **features: Any) -> RoutingDecision:
+        """
+        Run through all enabled routing layers in order.
+        Returns as soon as a layer makes a decision.
+
+        Accepts the same keyword features as :meth:`route_sync`; this async
+        variant exists for the LLM classifier layer, which must be awaited.
+        """
+        ctx, t0 = self._build_route_context(messages, **features)
+        decision = self._route_pre_llm(ctx, t0)
+        if decision:
+            return decision
+
+        # Layer 5: LLM classifier (if enabled)
+        if self._llm_enabled:
+            decision = await self._layer_llm_classify(ctx)
+            if decision:
+                decision.elapsed_ms = _elapsed_ms(t0)
+                return self._validate_health(decision, ctx)
+
+        return self._route_fallback_decision(ctx, t0)
+
+    def route_sync(
         self,
         messages: list[dict],
         *,
@@ -1094,13 +1400,54 @@ class Router:
         provider_health: dict[str, Any] | None = None,
         provider_runtime_state: dict[str, Any] | None = None,
     ) -> RoutingDecision:
+        """Route without coroutine machinery; for setups with the classifier off.
+
+        Runs layers 0–4 and the fallback chain exactly like :meth:`route` but
+        skips the (async) LLM classifier layer, so callers that know it is
+        disabled avoid a coroutine frame and event-loop hop per request.
         """
-        Run through all enabled routing layers in order.
-        Returns as soon as a layer makes a decision.
-        """
-        t0 = time.time()
-        system, last_user, full_text = _extract_text(messages)
-        total_tokens = _estimate_tokens(full_text)
+        ctx, t0 = self._build_route_context(
+            messages,
+            model_requested=model_requested,
+            has_tools=has_tools,
+            requested_max_tokens=requested_max_tokens,
+            client_profile=client_profile,
+            profile_hints=profile_hints,
+            hook_hints=hook_hints,
+            applied_hooks=applied_hooks,
+            headers=headers,
+            provider_health=provider_health,
+            provider_runtime_state=provider_runtime_state,
+        )
+        return self._route_pre_llm(ctx, t0) or self._route_fallback_decision(ctx, t0)
+
+    @property
+    def llm_classifier_enabled(self) -> bool:
+        """Whether the async classifier layer can run (drives route vs route_sync)."""
+        return self._llm_enabled
+
+    def _build_route_context(
+        self,
+        messages: list[dict],
+        *,
+        model_requested: str = "",
+        has_tools: bool = False,
+        requested_max_tokens: int | None = None,
+        client_profile: str = "generic",
+        profile_hints: dict[str, Any] | None = None,
+        hook_hints: dict[str, Any] | None = None,
+        applied_hooks: list[str] | None = None,
+        headers: dict[str, str] | None = None,
+        provider_health: dict[str, Any] | None = None,
+        provider_runtime_state: dict[str, Any] | None = None,
+    ) -> tuple[_RoutingContext, int]:
+        """Extract request features into a routing context plus the start stamp."""
+        t0 = time.perf_counter_ns()
+        system, last_user, parts = _extract_text(messages)
+        # Token estimate from part lengths; joining the conversation into one
+        # string here would be an O(context) alloc+copy most requests never use.
+        total_chars = sum(map(len, parts)) + (len(parts) - 1 if parts else 0)
+        total_tokens = max(1, total_chars // 4)
         stable_prefix_tokens = _estimate_tokens(system) if system else 0
         requested_output_tokens = requested_max_tokens or 0
         total_requested_tokens = total_tokens + requested_output_tokens
@@ -1108,7 +1455,7 @@ class Router:
         ctx = _RoutingContext(
             system_prompt=system,
             last_user_message=last_user,
-            full_text=full_text,
+            full_parts=parts,
             total_tokens=total_tokens,
             stable_prefix_tokens=stable_prefix_tokens,
             requested_output_tokens=requested_output_tokens,
@@ -1137,47 +1484,76 @@ class Router:
                 requested_output_tokens=requested_output_tokens,
             ),
         )
+        return ctx, t0
 
+    def _route_pre_llm(self, ctx: _RoutingContext, t0: int) -> RoutingDecision | None:
+        """Run the synchronous layers (0–4); None means fall through to LLM/fallback."""
         # Layer 0: Policy rules
         decision = self._layer_policy(ctx)
         if decision:
-            decision.elapsed_ms = (time.time() - t0) * 1000
+            decision.elapsed_ms = _elapsed_ms(t0)
             return self._validate_health(decision, ctx)
 
         # Layer 1: Static rules
         decision = self._layer_static(ctx)
         if decision:
-            decision.elapsed_ms = (time.time() - t0) * 1000
+            decision.elapsed_ms = _elapsed_ms(t0)
             return self._validate_health(decision, ctx)
 
         # Layer 2: Heuristic rules
         decision = self._layer_heuristic(ctx)
         if decision:
-            decision.elapsed_ms = (time.time() - t0) * 1000
+            decision.elapsed_ms = _elapsed_ms(t0)
             return self._validate_health(decision, ctx)
 
         # Layer 3: Request hook hints
         decision = self._layer_hook(ctx)
         if decision:
-            decision.elapsed_ms = (time.time() - t0) * 1000
+            decision.elapsed_ms = _elapsed_ms(t0)
             return self._validate_health(decision, ctx)
 
         # Layer 4: Client profile hints
         decision = self._layer_profile(ctx)
         if decision:
-            decision.elapsed_ms = (time.time() - t0) * 1000
+            decision.elapsed_ms = _elapsed_ms(t0)
             return self._validate_health(decision, ctx)
 
-        # Layer 5: LLM classifier (if enabled)
-        if self.config.llm_classifier.get("enabled"):
-            decision = await self._layer_llm_classify(ctx)
-            if decision:
-                decision.elapsed_ms = (time.time() - t0) * 1000
-                return self._validate_health(decision, ctx)
+        return None
 
-        # Fallback: first healthy provider in the chain
-        elapsed = (time.time() - t0) * 1000
-        fallback = self.config.fallback_chain[0] if self.config.fallback_chain else "deepseek-chat"
+    def _route_fallback_decision(self, ctx: _RoutingContext, t0: int) -> RoutingDecision:
+        # Fallback: first healthy provider in the chain, but keep a shared
+        # prompt prefix pinned to whichever provider served it last so its
+        # upstream prefix cache stays warm.
+        elapsed = _elapsed_ms(t0)
+        sticky = self._affinity_provider(ctx)
+        if sticky:
+            return self._enrich_decision_details(
+                RoutingDecision(
+                    provider_name=sticky,
+                    layer="fallback",
+                    rule_name="prefix-affinity",
+                    confidence=0.4,
+                    reason="No routing layer matched, reusing provider with warm prefix cache",
+                    elapsed_ms=elapsed,
+                ),
+                ctx,
+            )
+        indexed, depth = self.prefix_index.best_provider(ctx.full_text, self._fallback_chain)
+        if indexed and self._provider_usable(indexed, ctx):
+            self._remember_affinity(ctx, indexed)
+            return self._enrich_decision_details(
+                RoutingDecision(
+                    provider_name=indexed,
+                    layer="fallback",
+                    rule_name="prefix-index",
+                    confidence=0.4,
+                    reason=f"No routing layer matched, provider holds {depth} warm prefix block(s)",
+                    elapsed_ms=elapsed,
+                ),
+                ctx,
+            )
+        fallback = self._fallback_first
+        self._remember_affinity(ctx, fallback)
         return self._enrich_decision_details(
             RoutingDecision(
                 provider_name=fallback,
@@ -1208,7 +1584,7 @@ class Router:
         candidate_names: list[str] | None = None,
     ) -> RoutingDecision | None:
         """Route one non-chat request against providers with a required capability."""
-        t0 = time.time()
+        t0 = time.perf_counter_ns()
         total_tokens = _estimate_tokens(request_text) if request_text else 0
         ctx = _RoutingContext(
             system_prompt="",
@@ -1252,7 +1628,7 @@ class Router:
 
         policy_decision = self._layer_capability_policy(ctx, capability, base_select)
         if policy_decision:
-            policy_decision.elapsed_ms = (time.time() - t0) * 1000
+            policy_decision.elapsed_ms = _elapsed_ms(t0)
             return self._validate_health(
                 policy_decision,
                 ctx,
@@ -1291,7 +1667,7 @@ class Router:
                     "candidate_ranking": ranking,
                 },
             )
-            decision.elapsed_ms = (time.time() - t0) * 1000
+            decision.elapsed_ms = _elapsed_ms(t0)
             return self._validate_health(decision, ctx, required_capabilities=[capability])
 
         return None
@@ -2250,27 +2626,62 @@ class Router:
     # ── Layer 1: Static Rules ──────────────────────────────────
 
     def _layer_static(self, ctx: _RoutingContext) -> RoutingDecision | None:
-        cfg = self.config.static_rules
-        if not cfg.get("enabled"):
+        if not self._static_compiled:
             return None
 
-        for rule in cfg.get("rules", []):
-            match = rule.get("match", {})
-
-            if self._match_static(match, ctx):
-                logger.debug("Static rule matched: %s → %s", rule["name"], rule["route_to"])
+        lower_sys = ctx.system_prompt_lower
+        present = (
+            (_FIELD_MODEL if ctx.model_requested else 0)
+            | (_FIELD_SYSTEM if lower_sys else 0)
+            | (_FIELD_HEADERS if ctx.headers else 0)
+        )
+        for rule in self._static_compiled:
+            if rule.required_fields & ~present:
+                continue
+            if self._match_compiled(rule.match, ctx, lower_sys):
+                logger.debug("Static rule matched: %s → %s", rule.name, rule.route_to)
                 return RoutingDecision(
-                    provider_name=rule["route_to"],
+                    provider_name=rule.route_to,
                     layer="static",
-                    rule_name=rule["name"],
+                    rule_name=rule.name,
                     confidence=1.0,
-                    reason=f"Static rule '{rule['name']}' matched",
+                    reason=rule.reason,
                 )
 
         return None
 
+    def _match_compiled(self, block: _CompiledMatch, ctx: _RoutingContext, lower_sys: str) -> bool:
+        """Evaluate a precompiled static match block (patterns already lowercased)."""
+        if block.any_blocks:
+            return any(self._match_compiled(sub, ctx, lower_sys) for sub in block.any_blocks)
+
+        matched_any = False
+
+        if block.model_patterns:
+            matched_any = True
+            # Exact requests ("auto", "r1", "flash") hit the frozenset in O(1);
+            # the substring scan stays as the fallback for composite names.
+            if ctx.model_requested not in block.model_exact and not any(
+                p in ctx.model_requested for p in block.model_patterns
+            ):
+                return False
+
+        if block.system_keywords:
+            matched_any = True
+            if not any(kw in lower_sys for kw in block.system_keywords):
+                return False
+
+        if block.header_map:
+            matched_any = True
+            for header_name, patterns in block.header_map:
+                header_val = ctx.headers_lower.get(header_name, "")
+                if not any(p in header_val for p in patterns):
+                    return False
+
+        return matched_any
+
     def _match_static(self, match: dict, ctx: _RoutingContext) -> bool:
-        """Evaluate a static match block."""
+        """Evaluate a raw static match block (kept for tests and policy composition)."""
         # "any" → at least one sub-condition must match
         if "any" in match:
             return any(self._match_static(sub, ctx) for sub in match["any"])
@@ -2307,12 +2718,17 @@ class Router:
     # ── Layer 2: Heuristic Rules ───────────────────────────────
 
     def _layer_heuristic(self, ctx: _RoutingContext) -> RoutingDecision | None:
-        cfg = self.config.heuristic_rules
-        if not cfg.get("enabled"):
+        if not self._heuristic_enabled:
             return None
 
-        for rule in cfg.get("rules", []):
-            matched, match_details = self._evaluate_heuristic_match(rule, ctx)
+        keyword_hits = frozenset(self._keyword_scanner.scan(ctx.last_user_message_lower))
+        for rule, reason, is_fallthrough in self._heuristic_rules:
+            matched, match_details = self._evaluate_heuristic_match(
+                rule,
+                ctx,
+                keyword_hits=keyword_hits,
+                fallthrough=is_fallthrough,
+            )
             if matched:
                 logger.debug("Heuristic rule matched: %s → %s", rule["name"], rule["route_to"])
                 return RoutingDecision(
@@ -2320,7 +2736,7 @@ class Router:
                     layer="heuristic",
                     rule_name=rule["name"],
                     confidence=0.8,
-                    reason=f"Heuristic rule '{rule['name']}' matched",
+                    reason=reason,
                     details={"heuristic_match": match_details},
                 )
 
@@ -2331,15 +2747,29 @@ class Router:
         matched, _ = self._evaluate_heuristic_match({"name": "", "match": match}, ctx)
         return matched
 
-    def _evaluate_heuristic_match(self, rule: dict[str, Any], ctx: _RoutingContext) -> tuple[bool, dict[str, Any]]:
-        """Evaluate a heuristic match block."""
+    def _evaluate_heuristic_match(
+        self,
+        rule: dict[str, Any],
+        ctx: _RoutingContext,
+        *,
+        keyword_hits: frozenset[str] | None = None,
+        fallthrough: bool | None = None,
+    ) -> tuple[bool, dict[str, Any]]:
+        """Evaluate a heuristic match block.
+
+        ``keyword_hits`` is the precomputed scanner pass over the lowered user
+        message; when provided, keywords known to the scanner are checked by
+        set membership instead of rescanning the text.
+        """
         match = rule.get("match", {})
         rule_name = str(rule.get("name") or "")
+        if fallthrough is None:
+            fallthrough = bool(match.get("fallthrough"))
         # fallthrough = always matches (used as default).
         # Exception: bypass it when short_complex=True or when a per-request
         # provider preference is set — both cases should fall through to the
         # scoring layer rather than committing to a catch-all cheap route.
-        if match.get("fallthrough"):
+        if fallthrough:
             ri = dict(getattr(ctx, "request_insights", {}) or {})
             hook_hints = dict(getattr(ctx, "hook_hints", {}) or {})
             routing_mode = str(hook_hints.get("routing_mode") or "").strip()
@@ -2408,10 +2838,19 @@ class Router:
             # CRITICAL: Score only user messages, NOT the system prompt.
             # ClawRouter insight: OpenClaw's system prompt is keyword-rich
             # and would inflate every request to the reasoning tier.
-            search_text = ctx.last_user_message.lower()
-            matched_keywords = [
-                str(kw).strip().lower() for kw in keywords if _keyword_matches_text(str(kw), search_text)
-            ]
+            search_text = getattr(ctx, "last_user_message_lower", None)
+            if search_text is None:
+                search_text = ctx.last_user_message.lower()
+            matched_keywords = []
+            for kw in keywords:
+                normalized = str(kw).strip().lower()
+                if not normalized:
+                    continue
+                if keyword_hits is not None and normalized in self._keyword_vocab:
+                    if normalized in keyword_hits:
+                        matched_keywords.append(normalized)
+                elif _keyword_matches_text(normalized, search_text):
+                    matched_keywords.append(normalized)
             hit_count = len(matched_keywords)
             request_insights = dict(getattr(ctx, "request_insights", {}) or {})
             complexity_profile = str(request_insights.get("complexity_profile") or "")
@@ -2421,7 +2860,11 @@ class Router:
 
             if (
                 ctx.client_profile == "opencode"
-                and any(_keyword_matches_text(term, search_text) for term in _OPENCODE_COMPLEXITY_HINTS)
+                and (
+                    not keyword_hits.isdisjoint(_OPENCODE_COMPLEXITY_HINTS)
+                    if keyword_hits is not None
+                    else any(_keyword_matches_text(term, search_text) for term in _OPENCODE_COMPLEXITY_HINTS)
+                )
                 and any(term in _OPENCODE_COMPLEXITY_RULE_KEYWORDS for term in matched_keywords)
             ):
                 min_matches = max(1, int(min_matches) - 1)
@@ -2483,11 +2926,8 @@ class Router:
 
     async def _layer_llm_classify(self, ctx: _RoutingContext) -> RoutingDecision | None:
         """Use a cheap LLM to classify the task. Imported lazily to avoid circular deps."""
-        cfg = self.config.llm_classifier
-        prompt_template = cfg.get("prompt", "")
-        category_routing = cfg.get("category_routing", {})
-
-        prompt = prompt_template.replace("{last_user_message}", ctx.last_user_message[:500])
+        category_routing = self._llm_category_routing
+        prompt = self._llm_prompt_template.replace("{last_user_message}", ctx.last_user_message[:500])
 
         # We need to call the classifier provider – this is done by the dispatcher
         # which injects a classify callback
@@ -2546,8 +2986,7 @@ class Router:
                 reason_suffix,
             )
             fallback_candidates = []
-            for fallback in self.config.fallback_chain:
-                provider = self.config.provider(fallback) or {}
+            for fallback, provider in self._fallback_providers:
                 fb_health = ctx.provider_health.get(fallback, {})
                 if not fb_health.get("healthy", True):
                     continue
@@ -2604,7 +3043,11 @@ class _RoutingContext:
     __slots__ = (
         "system_prompt",
         "last_user_message",
-        "full_text",
+        "system_prompt_lower",
+        "last_user_message_lower",
+        "headers_lower",
+        "_full_parts",
+        "_full_text",
         "total_tokens",
         "stable_prefix_tokens",
         "requested_output_tokens",
@@ -2629,8 +3072,75 @@ class _RoutingContext:
         "_classify_fn",
     )
 
-    def __init__(self, **kwargs: Any):
-        for k, v in kwargs.items():
-            setattr(self, k, v)
-        if not hasattr(self, "_classify_fn"):
-            self._classify_fn = None
+    def __init__(
+        self,
+        *,
+        system_prompt: str = "",
+        last_user_message: str = "",
+        total_tokens: int = 0,
+        stable_prefix_tokens: int = 0,
+        requested_output_tokens: int = 0,
+        total_requested_tokens: int = 0,
+        requested_image_outputs: int = 0,
+        requested_image_side_px: int = 0,
+        requested_image_size: str = "",
+        requested_image_policy: str = "",
+        required_capability: str = "",
+        cache_preference: str = "",
+        model_requested: str = "",
+        has_tools: bool = False,
+        client_profile: str = "generic",
+        profile_hints: dict[str, Any] | None = None,
+        hook_hints: dict[str, Any] | None = None,
+        applied_hooks: list[str] | None = None,
+        headers: dict[str, str] | None = None,
+        provider_health: dict[str, Any] | None = None,
+        provider_runtime_state: dict[str, Any] | None = None,
+        providers: dict[str, Any] | None = None,
+        request_insights: dict[str, Any] | None = None,
+        full_text: str | None = None,
+        full_parts: list[str] | None = None,
+        _classify_fn: Any = None,
+    ):
+        self.system_prompt = system_prompt
+        self.last_user_message = last_user_message
+        self.total_tokens = total_tokens
+        self.stable_prefix_tokens = stable_prefix_tokens
+        self.requested_output_tokens = requested_output_tokens
+        self.total_requested_tokens = total_requested_tokens
+        self.requested_image_outputs = requested_image_outputs
+        self.requested_image_side_px = requested_image_side_px
+        self.requested_image_size = requested_image_size
+        self.requested_image_policy = requested_image_policy
+        self.required_capability = required_capability
+        self.cache_preference = cache_preference
+        self.model_requested = model_requested
+        self.has_tools = has_tools
+        self.client_profile = client_profile
+        self.profile_hints = profile_hints if profile_hints is not None else {}
+        self.hook_hints = hook_hints if hook_hints is not None else {}
+        self.applied_hooks = applied_hooks if applied_hooks is not None else []
+        self.headers = headers if headers is not None else {}
+        self.provider_health = provider_health if provider_health is not None else {}
+        self.provider_runtime_state = provider_runtime_state if provider_runtime_state is not None else {}
+        self.providers = providers if providers is not None else {}
+        self.request_insights = request_insights if request_insights is not None else {}
+        self._full_text = full_text
+        self._full_parts = full_parts
+        self._classify_fn = _classify_fn
+        # Lowercased views, computed once per request: rule matching would
+        # otherwise re-lower the same strings once per rule with that branch.
+        self.system_prompt_lower = system_prompt.lower()
+        self.last_user_message_lower = last_user_message.lower()
+        self.headers_lower = {k: v.lower() for k, v in self.headers.items()}
+
+    @property
+    def full_text(self) -> str:
+        """Joined conversation text, materialized only when first consumed."""
+        if self._full_text is None:
+            self._full_text = "\n".join(self._full_parts) if self._full_parts else ""
+        return self._full_text
+
+    @full_text.setter
+    def full_text(self, value: str) -> None:
+        self._full_text = value
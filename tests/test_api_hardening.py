@@ -88,9 +88,14 @@ class _FailingProviderStub(_ProviderStub):
 
 
 class _MetricsStub:
+    write_generation = 0
+
     def log_request(self, **_kwargs):
         return None
 
+    async def run_off_loop(self, fn, /, *args, **kwargs):
+        return fn(*args, **kwargs)
+
     def get_totals(self, **_kwargs):
         return {}
 
@@ -726,3 +726,63 @@ metrics:
     assert cfg.model_shortcuts["shortcuts"]["default-pro"]["target"] == "gemini-pro-high"
     assert cfg.anthropic_bridge["model_aliases"]["claude-opus-4-6"] == "gemini-pro-high"
     assert cfg.auto_update["provider_scope"]["allow_providers"] == ["gemini-pro-high"]
+
+
+# ── Config snapshot cache ─────────────────────────────────────────────────────
+
+_SNAPSHOT_CONFIG = """
+server:
+  host: "127.0.0.1"
+  port: 8090
+providers:
+  snap-provider:
+    backend: openai-compat
+    base_url: "https://api.example.com/v1"
+    api_key: "${SNAP_TEST_KEY}"
+    model: "chat-model"
+fallback_chain: []
+metrics:
+  enabled: false
+"""
+
+
+def test_config_snapshot_reused_on_warm_load(tmp_path, monkeypatch):
+    """A second load with unchanged file and env hits the pickled snapshot."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("SNAP_TEST_KEY", "first")
+    path = tmp_path / "config.yaml"
+    path.write_text(_SNAPSHOT_CONFIG)
+
+    cfg = load_config(path)
+    assert cfg.providers["snap-provider"]["api_key"] == "first"
+    snapshot = tmp_path / "cache" / "faigate" / "config-snapshot.pkl"
+    assert snapshot.exists()
+
+    warm = load_config(path)
+    assert warm.providers["snap-provider"]["api_key"] == "first"
+
+
+def test_config_snapshot_invalidated_by_env_change(tmp_path, monkeypatch):
+    """Changing a ${VAR} referenced by the config must bypass the snapshot."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("SNAP_TEST_KEY", "first")
+    path = tmp_path / "config.yaml"
+    path.write_text(_SNAPSHOT_CONFIG)
+    load_config(path)
+
+    monkeypatch.setenv("SNAP_TEST_KEY", "second")
+    cfg = load_config(path)
+    assert cfg.providers["snap-provider"]["api_key"] == "second"
+
+
+def test_config_snapshot_disabled_via_env(tmp_path, monkeypatch):
+    """FAIGATE_CONFIG_SNAPSHOT=0 must skip both read and write of the cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("FAIGATE_CONFIG_SNAPSHOT", "0")
+    monkeypatch.setenv("SNAP_TEST_KEY", "first")
+    path = tmp_path / "config.yaml"
+    path.write_text(_SNAPSHOT_CONFIG)
+
+    cfg = load_config(path)
+    assert cfg.providers["snap-provider"]["api_key"] == "first"
+    assert not (tmp_path / "cache" / "faigate" / "config-snapshot.pkl").exists()
@@ -44,6 +44,9 @@ def test_main_uses_explicit_config_arg(monkeypatch):
         "port": 9011,
         "log_level": "warning",
         "reload": False,
+        "workers": None,
+        "loop": "auto",
+        "http": "auto",
     }
 
 
@@ -275,3 +275,120 @@ def test_metrics_store_tracks_operator_events(tmp_path):
     assert breakdown[0]["events"] == 1
 
     metrics.close()
+
+
+async def test_batch_writer_coalesces_and_reads_flush(tmp_path):
+    """With batching on, log_request enqueues and reads see flushed rows."""
+    db_path = tmp_path / "faigate.db"
+    metrics = MetricsStore(str(db_path))
+    metrics.init()
+    metrics.start_batch_writer(batch_size=100, flush_interval=60.0)
+
+    for _ in range(5):
+        row_id = metrics.log_request(provider="p", model="m", layer="static", rule_name="r")
+        assert row_id is None  # batched writes return no row id
+
+    # A read flushes the queue first, so all 5 rows are visible.
+    totals = metrics.get_totals()
+    assert totals["total_requests"] == 5
+
+    await metrics.stop_batch_writer()
+    metrics.close()
+
+
+async def test_batch_writer_drops_beyond_max_pending(tmp_path):
+    db_path = tmp_path / "faigate.db"
+    metrics = MetricsStore(str(db_path))
+    metrics.init()
+    metrics.start_batch_writer(max_pending=2, batch_size=100, flush_interval=60.0)
+
+    for _ in range(4):
+        metrics.log_request(provider="p", model="m", layer="static", rule_name="r")
+
+    assert metrics.dropped_writes == 2
+    assert metrics.get_totals()["total_requests"] == 2
+
+    await metrics.stop_batch_writer()
+    metrics.close()
+
+
+def test_rollup_tables_track_daily_and_hourly_series(tmp_path):
+    """Time-series queries are served from the incremental rollup tables."""
+    db_path = tmp_path / "faigate.db"
+    metrics = MetricsStore(str(db_path))
+    metrics.init()
+    metrics.log_request(
+        provider="p1",
+        model="m",
+        layer="static",
+        rule_name="r",
+        prompt_tokens=10,
+        completion_tokens=5,
+        cost_usd=0.2,
+    )
+    metrics.log_request(provider="p2", model="m", layer="static", rule_name="r", success=False)
+
+    daily = metrics.get_daily_totals(7)
+    assert len(daily) == 1
+    assert daily[0]["requests"] == 2
+    assert daily[0]["tokens"] == 15
+    assert daily[0]["failures"] == 1
+
+    hourly = metrics.get_hourly_series(24)
+    assert sum(row["requests"] for row in hourly) == 2
+
+    # Provider filters are answered from the rollups too.
+    p1_only = metrics.get_daily_totals(7, provider="p1")
+    assert p1_only[0]["requests"] == 1
+
+    # Rollup rows exist in the DB itself.
+    rollup = sqlite3.connect(str(db_path)).execute("SELECT SUM(requests) FROM requests_daily").fetchone()
+    assert rollup[0] == 2
+    metrics.close()
+
+
+def test_rollup_backfill_for_existing_databases(tmp_path):
+    """Opening a DB with empty rollups rebuilds them from the requests table."""
+    db_path = tmp_path / "faigate.db"
+    metrics = MetricsStore(str(db_path))
+    metrics.init()
+    metrics.log_request(provider="p1", model="m", layer="static", rule_name="r", cost_usd=0.5)
+    metrics.close()
+
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("DELETE FROM requests_hourly")
+    conn.execute("DELETE FROM requests_daily")
+    conn.commit()
+    conn.close()
+
+    reopened = MetricsStore(str(db_path))
+    reopened.init()
+    daily = reopened.get_daily_totals(7)
+    assert daily[0]["requests"] == 1
+    reopened.close()
+
+
+def test_recompute_costs_rewrites_rows_and_rollups(tmp_path):
+    """A pricing change can be applied retroactively across historical rows."""
+    db_path = tmp_path / "faigate.db"
+    metrics = MetricsStore(str(db_path))
+    metrics.init()
+    metrics.log_request(
+        provider="p1",
+        model="m",
+        layer="static",
+        rule_name="r",
+        prompt_tokens=1_000_000,
+        completion_tokens=0,
+        cost_usd=0.27,
+    )
+    metrics.log_request(provider="other", model="m", layer="static", rule_name="r", cost_usd=0.5)
+
+    updated = metrics.recompute_costs({"p1": {"input": 0.10, "output": 1.10}})
+    assert updated == 1
+
+    totals = metrics.get_totals()
+    assert abs(totals["total_cost_usd"] - 0.6) < 1e-9  # 0.10 recomputed + 0.5 untouched
+    daily = metrics.get_daily_totals(7, provider="p1")
+    assert abs(daily[0]["cost_usd"] - 0.10) < 1e-9
+    metrics.close()
@@ -21,6 +21,7 @@ Two regressions from the 2026-04-26 incident:
 
 from __future__ import annotations
 
+import json
 import sys
 import types
 
@@ -101,8 +102,12 @@ def _install_capture_post(backend: ProviderBackend) -> dict:
                 "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
             }
 
-    async def _fake_post(url, json=None, **kw):
-        captured.update(json or {})
+        @property
+        def content(self) -> bytes:
+            return json.dumps(self.json()).encode()
+
+    async def _fake_post(url, content=None, **kw):
+        captured.update(json.loads(content) if content else {})
         return _FakeResp()
 
     backend._client.post = _fake_post  # type: ignore[attr-defined]
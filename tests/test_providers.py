@@ -7,6 +7,7 @@ invalid payloads to upstream APIs.
 
 # ruff: noqa: E402
 
+import json
 import sys
 import types
 from pathlib import Path
@@ -98,8 +99,12 @@ def _install_fake_post(backend: ProviderBackend) -> dict:
                 },
             }
 
-    async def _fake_post(url, json=None, **kw):
-        captured.update(json or {})
+        @property
+        def content(self) -> bytes:
+            return json.dumps(self.json()).encode()
+
+    async def _fake_post(url, content=None, **kw):
+        captured.update(json.loads(content) if content else {})
         return _FakeResp()
 
     backend._client.post = _fake_post  # type: ignore[attr-defined]
@@ -410,9 +415,9 @@ async def test_codex_responses_payload_maps_to_supported_model_and_openai_output
             '"model":"gpt-5-codex","usage":{"input_tokens":19,"output_tokens":5,"total_tokens":24}}}\n\n'
         )
 
-    async def _fake_post(url, json=None, headers=None, **_kw):
+    async def _fake_post(url, content=None, headers=None, **_kw):
         captured["url"] = url
-        captured["json"] = json or {}
+        captured["json"] = json.loads(content) if content else {}
         captured["headers"] = headers or {}
         return _FakeResp()
 
@@ -457,9 +462,9 @@ async def test_codex_responses_normalizes_tool_messages():
             '"model":"gpt-5-codex","usage":{"input_tokens":19,"output_tokens":5,"total_tokens":24}}}\n\n'
         )
 
-    async def _fake_post(url, json=None, headers=None, **_kw):
+    async def _fake_post(url, content=None, headers=None, **_kw):
         captured["url"] = url
-        captured["json"] = json or {}
+        captured["json"] = json.loads(content) if content else {}
         captured["headers"] = headers or {}
         return _FakeResp()
 
@@ -535,9 +540,9 @@ async def test_codex_responses_forward_tools_and_return_tool_calls():
             '"output_tokens":5,"total_tokens":24}}}\n\n'
         )
 
-    async def _fake_post(url, json=None, headers=None, **_kw):
+    async def _fake_post(url, content=None, headers=None, **_kw):
         captured["url"] = url
-        captured["json"] = json or {}
+        captured["json"] = json.loads(content) if content else {}
         return _FakeResp()
 
     backend._client.post = _fake_post  # type: ignore[attr-defined]
@@ -629,10 +634,10 @@ async def test_codex_responses_stream_maps_to_openai_chunks():
             ]:
                 yield line
 
-    def _fake_stream(method, url, json=None, headers=None, **_kw):
+    def _fake_stream(method, url, content=None, headers=None, **_kw):
         captured["method"] = method
         captured["url"] = url
-        captured["json"] = json or {}
+        captured["json"] = json.loads(content) if content else {}
         captured["headers"] = headers or {}
         return _FakeStreamResp()
 
@@ -808,9 +813,13 @@ class TestImageGeneration:
                     "usage": {"prompt_tokens": 1, "completion_tokens": 1},
                 }
 
-        async def _fake_post(url, json=None, headers=None, **_kw):
+            @property
+            def content(self) -> bytes:
+                return json.dumps(self.json()).encode()
+
+        async def _fake_post(url, content=None, headers=None, **_kw):
             captured["url"] = url
-            captured["json"] = json or {}
+            captured["json"] = json.loads(content) if content else {}
             captured["headers"] = headers or {}
             return _FakeResp()
 
@@ -820,6 +829,51 @@ class TestImageGeneration:
 
         assert captured["url"] == "https://api.example.com/v1/responses/chat"
 
+    @pytest.mark.asyncio
+    async def test_batch_complete_falls_back_to_concurrent_completes(self):
+        """Without supports_batch_api, batch_complete issues one POST per batch."""
+        backend = ProviderBackend(
+            "cloud-default",
+            {
+                "backend": "openai-compat",
+                "base_url": "https://api.example.com/v1",
+                "api_key": "secret",
+                "model": "gpt-4o",
+            },
+        )
+        calls: list[dict] = []
+
+        class _FakeResp:
+            status_code = 200
+
+            def json(self):
+                return {
+                    "id": "chatcmpl-test",
+                    "choices": [{"message": {"role": "assistant", "content": "ok"}}],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1},
+                }
+
+            @property
+            def content(self) -> bytes:
+                return json.dumps(self.json()).encode()
+
+        async def _fake_post(url, content=None, headers=None, **_kw):
+            calls.append(json.loads(content) if content else {})
+            return _FakeResp()
+
+        backend._client.post = _fake_post  # type: ignore[attr-defined]
+
+        results = await backend.batch_complete(
+            [
+                [{"role": "user", "content": "first"}],
+                [{"role": "user", "content": "second"}],
+            ]
+        )
+
+        assert len(calls) == 2
+        assert len(results) == 2
+        assert all(r["choices"][0]["message"]["content"] == "ok" for r in results)
+
     @pytest.mark.asyncio
     async def test_openai_image_generation_posts_to_images_endpoint(self):
         backend = ProviderBackend(
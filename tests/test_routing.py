@@ -37,8 +37,9 @@ _httpx.TimeoutException = Exception
 _httpx.ConnectError = Exception
 sys.modules["httpx"] = _httpx
 
+from faigate._keyword_scan import KeywordScanner
 from faigate.config import load_config
-from faigate.metrics import calc_cost
+from faigate.metrics import calc_cost, calc_cost_batch
 from faigate.router import Router
 
 
@@ -87,6 +88,12 @@ class TestCostCalculation:
         cost = calc_cost(0, 0, {"input": 0.27, "output": 1.10})
         assert cost == 0.0
 
+    def test_batch_matches_scalar(self):
+        pricing = {"input": 0.27, "output": 1.10, "cache_read": 0.07}
+        rows = [(1000, 1000, 0, 0), (1000, 1000, 800, 200), (0, 0, 0, 0)]
+        batched = calc_cost_batch(rows, pricing)
+        assert batched == [calc_cost(pt, ct, pricing, cache_hit=ch, cache_miss=cm) for pt, ct, ch, cm in rows]
+
     def test_flash_lite_cheapest(self):
         ds = calc_cost(1_000_000, 1_000_000, {"input": 0.27, "output": 1.10})
         fl = calc_cost(1_000_000, 1_000_000, {"input": 0.075, "output": 0.30})
@@ -290,6 +297,68 @@ class TestHealthFallback:
         assert "fallback" in d.rule_name
 
 
+# ── Keyword automaton ──────────────────────────────────────────
+
+
+class TestKeywordScanner:
+    def test_single_scan_matches_all_keywords(self):
+        ac = KeywordScanner({"race condition", "debug", "ci/cd", "deadlock"})
+        hits = ac.scan("debug this race condition in the ci/cd pipeline")
+        assert hits == {"race condition", "debug", "ci/cd"}
+
+    def test_word_boundaries_respected(self):
+        ac = KeywordScanner({"test", "r1"})
+        assert ac.scan("the latest r1 release") == {"r1"}
+        assert ac.scan("run the test now") == {"test"}
+        assert ac.scan("r1b and contest") == set()
+
+    def test_overlapping_keywords_all_reported(self):
+        ac = KeywordScanner({"unit test", "test", "integration test"})
+        assert ac.scan("write a unit test") == {"unit test", "test"}
+
+
+# ── Prefix-cache affinity ──────────────────────────────────────
+
+
+class TestPrefixAffinity:
+    def test_affinity_remembers_and_respects_health(self, router, monkeypatch):
+        monkeypatch.setattr(router, "_provider_in_hard_cooldown", lambda name, ctx: (False, {}))
+        monkeypatch.setattr(router, "_provider_fits_request_dimensions", lambda name, provider, ctx: True)
+        ctx = types.SimpleNamespace(system_prompt="shared RAG preamble", provider_health={})
+
+        router._remember_affinity(ctx, "deepseek-v4-flash")  # noqa: SLF001
+        assert router._affinity_provider(ctx) == "deepseek-v4-flash"  # noqa: SLF001
+
+        # Unhealthy sticky providers are ignored rather than pinned.
+        ctx.provider_health = {"deepseek-v4-flash": {"healthy": False}}
+        assert router._affinity_provider(ctx) is None  # noqa: SLF001
+
+    def test_prefix_index_prefers_deepest_warm_prefix(self, router):
+        index = router.prefix_index
+        shared = "x" * 5000
+        index.mark(shared[:2000], "provider-a")
+        index.mark(shared, "provider-b")
+
+        assert index.warm_blocks(shared, "provider-a") == 1
+        assert index.warm_blocks(shared, "provider-b") == 5
+        best, depth = index.best_provider(shared, ["provider-a", "provider-b"])
+        assert (best, depth) == ("provider-b", 5)
+
+        # Unseen prompts have no warm provider.
+        assert index.best_provider("totally different", ["provider-a"]) == (None, 0)
+
+    def test_affinity_entries_expire(self, router, monkeypatch):
+        monkeypatch.setattr(router, "_provider_in_hard_cooldown", lambda name, ctx: (False, {}))
+        monkeypatch.setattr(router, "_provider_fits_request_dimensions", lambda name, provider, ctx: True)
+        ctx = types.SimpleNamespace(system_prompt="shared RAG preamble", provider_health={})
+
+        router._remember_affinity(ctx, "deepseek-v4-flash")  # noqa: SLF001
+        key = hash(ctx.system_prompt)
+        provider, stamp = router._prefix_affinity[key]  # noqa: SLF001
+        router._prefix_affinity[key] = (provider, stamp - 9_999)  # noqa: SLF001
+        assert router._affinity_provider(ctx) is None  # noqa: SLF001
+
+
 # ── Regression: content=None handling (GitHub: fix/runtime-bugs) ──────────────
 
 